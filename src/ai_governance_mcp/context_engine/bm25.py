@@ -0,0 +1,163 @@
+"""Precomputed BM25 postings for the Context Engine.
+
+The indexer persists BM25 term statistics (vocabulary, IDF, per-term
+posting lists, document lengths) alongside the tokenized corpus. The
+project manager loads them lazily on the first keyword query instead of
+rebuilding a BM25Okapi object from the full corpus at startup.
+
+Scoring matches rank_bm25.BM25Okapi (k1=1.5, b=0.75, epsilon=0.25 IDF
+floor) but only touches the documents that contain a query term.
+
+Security: persisted as plain NumPy arrays (loaded with allow_pickle=False).
+The vocabulary is stored as a newline-joined UTF-8 blob — tokens come from
+the `\\w+` tokenizer and never contain newlines.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+
+# Bump on any change to the persisted array layout
+BM25_POSTINGS_VERSION = 1
+
+# BM25Okapi defaults (rank_bm25)
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_EPSILON = 0.25
+
+_ARRAY_KEYS = ("version", "terms", "idf", "indptr", "doc_ids", "term_freqs", "doc_len")
+
+
+class BM25Postings:
+    """BM25Okapi-compatible scorer over term-major (CSR) posting lists.
+
+    Postings for term ``t`` live in ``doc_ids[indptr[t]:indptr[t + 1]]``
+    with matching ``term_freqs``. Exposes ``get_scores(query_tokens)`` so it
+    is a drop-in for BM25Okapi in ProjectManager.
+    """
+
+    def __init__(
+        self,
+        terms: list[str],
+        idf: np.ndarray,
+        indptr: np.ndarray,
+        doc_ids: np.ndarray,
+        term_freqs: np.ndarray,
+        doc_len: np.ndarray,
+    ) -> None:
+        if not (len(terms) == len(idf) == len(indptr) - 1):
+            raise ValueError("BM25 postings vocabulary/idf/indptr size mismatch")
+        if len(doc_ids) != len(term_freqs) or int(indptr[-1]) != len(doc_ids):
+            raise ValueError("BM25 postings indptr/doc_ids/term_freqs mismatch")
+
+        self.terms = terms
+        self.idf = idf
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_len = doc_len
+        self.corpus_size = len(doc_len)
+        self._term_index = {term: i for i, term in enumerate(terms)}
+
+        total_len = float(doc_len.sum())
+        self.avgdl = total_len / self.corpus_size if self.corpus_size else 0.0
+        # Length normalization is query-independent — compute once per load
+        if self.avgdl > 0:
+            self._len_norm = BM25_K1 * (
+                1 - BM25_B + BM25_B * doc_len.astype(np.float64) / self.avgdl
+            )
+        else:
+            self._len_norm = np.full(self.corpus_size, BM25_K1 * (1 - BM25_B))
+
+    @classmethod
+    def from_corpus(cls, corpus: list[list[str]]) -> "BM25Postings":
+        """Build postings from a tokenized corpus (one token list per chunk)."""
+        postings: dict[str, list[tuple[int, int]]] = {}
+        doc_len = np.zeros(len(corpus), dtype=np.int32)
+        for doc_id, doc in enumerate(corpus):
+            doc_len[doc_id] = len(doc)
+            for term, tf in Counter(doc).items():
+                postings.setdefault(term, []).append((doc_id, tf))
+
+        terms = list(postings)
+        n_docs = len(corpus)
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        idf = np.zeros(len(terms), dtype=np.float64)
+        for i, term in enumerate(terms):
+            df = len(postings[term])
+            indptr[i + 1] = indptr[i] + df
+            idf[i] = math.log(n_docs - df + 0.5) - math.log(df + 0.5)
+
+        # BM25Okapi floor: negative IDF (term in >half the docs) → eps * mean IDF
+        if len(idf):
+            eps = BM25_EPSILON * (idf.sum() / len(idf))
+            idf[idf < 0] = eps
+
+        nnz = int(indptr[-1])
+        doc_ids = np.empty(nnz, dtype=np.int32)
+        term_freqs = np.empty(nnz, dtype=np.int32)
+        for i, term in enumerate(terms):
+            start = indptr[i]
+            for offset, (doc_id, tf) in enumerate(postings[term]):
+                doc_ids[start + offset] = doc_id
+                term_freqs[start + offset] = tf
+
+        return cls(terms, idf, indptr, doc_ids, term_freqs, doc_len)
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "BM25Postings":
+        """Rebuild from persisted arrays.
+
+        Raises:
+            ValueError: If the layout version or array shapes don't match.
+        """
+        missing = [k for k in _ARRAY_KEYS if k not in arrays]
+        if missing:
+            raise ValueError(f"BM25 postings missing arrays: {missing}")
+        version = int(arrays["version"][0]) if len(arrays["version"]) else -1
+        if version != BM25_POSTINGS_VERSION:
+            raise ValueError(
+                f"BM25 postings version {version} != {BM25_POSTINGS_VERSION}"
+            )
+        blob = arrays["terms"].tobytes().decode("utf-8")
+        terms = blob.split("\n") if blob else []
+        return cls(
+            terms,
+            arrays["idf"],
+            arrays["indptr"],
+            arrays["doc_ids"],
+            arrays["term_freqs"],
+            arrays["doc_len"],
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Serialize to a dict of plain arrays (np.savez-compatible)."""
+        blob = "\n".join(self.terms).encode("utf-8")
+        return {
+            "version": np.array([BM25_POSTINGS_VERSION], dtype=np.int32),
+            "terms": np.frombuffer(blob, dtype=np.uint8),
+            "idf": self.idf,
+            "indptr": self.indptr,
+            "doc_ids": self.doc_ids,
+            "term_freqs": self.term_freqs,
+            "doc_len": self.doc_len,
+        }
+
+    def get_scores(self, query: list[str]) -> np.ndarray:
+        """Score every document for a tokenized query (BM25Okapi semantics).
+
+        Repeated query tokens contribute once per occurrence, as in rank_bm25.
+        """
+        scores = np.zeros(self.corpus_size)
+        for token in query:
+            t = self._term_index.get(token)
+            if t is None:
+                continue
+            start, end = self.indptr[t], self.indptr[t + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.term_freqs[start:end].astype(np.float64)
+            scores[docs] += self.idf[t] * (
+                tf * (BM25_K1 + 1) / (tf + self._len_norm[docs])
+            )
+        return scores
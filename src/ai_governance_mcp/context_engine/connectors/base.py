@@ -5,12 +5,32 @@ into indexable chunks. Each connector handles a specific content type
 (code, documents, data, images, PDFs) and produces ContentChunk objects.
 """
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 from ..models import ContentChunk, FileMetadata
 
 
+def relative_display_path(file_path: Path, project_root: Path | None) -> str:
+    """Return file_path relative to project_root when inside it, else as-is.
+
+    Files reach connectors from discovery under the project root, so the
+    common case is a plain string-prefix strip; PurePath.relative_to (and
+    is_relative_to, which builds the same result) is only the fallback.
+    """
+    path_str = str(file_path)
+    if project_root is None:
+        return path_str
+    root_str = str(project_root)
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if path_str.startswith(prefix):
+        return path_str[len(prefix) :]
+    if file_path.is_relative_to(project_root):
+        return str(file_path.relative_to(project_root))
+    return path_str
+
+
 class BaseConnector(ABC):
     """Abstract base class for source connectors.
 
@@ -7,7 +7,7 @@ line-based chunking when Tree-sitter grammars are not available.
 
 from pathlib import Path
 
-from .base import BaseConnector
+from .base import BaseConnector, relative_display_path
 from ..models import ContentChunk, FileMetadata
 
 
@@ -219,10 +219,7 @@ class CodeConnector(BaseConnector):
             return []
 
         # Compute display path (relative to project root when available)
-        if project_root and file_path.is_relative_to(project_root):
-            display_path = str(file_path.relative_to(project_root))
-        else:
-            display_path = str(file_path)
+        display_path = relative_display_path(file_path, project_root)
 
         if self._tree_sitter_available:
             return self._parse_with_tree_sitter(file_path, content, display_path)
@@ -11,7 +11,7 @@ from pathlib import Path
 # safe_load only
 import yaml  # nosec B506
 
-from .base import BaseConnector
+from .base import BaseConnector, relative_display_path
 from ..models import ContentChunk, FileMetadata
 
 
@@ -40,10 +40,7 @@ class DocumentConnector(BaseConnector):
             return []
 
         # Compute display path (relative to project root when available)
-        if project_root and file_path.is_relative_to(project_root):
-            display_path = str(file_path.relative_to(project_root))
-        else:
-            display_path = str(file_path)
+        display_path = relative_display_path(file_path, project_root)
 
         if file_path.suffix.lower() in {".md", ".markdown"}:
             return self._parse_markdown(file_path, content, display_path)
@@ -9,7 +9,7 @@ discoverability.
 import logging
 from pathlib import Path
 
-from .base import BaseConnector
+from .base import BaseConnector, relative_display_path
 from ..models import ContentChunk, FileMetadata
 
 logger = logging.getLogger("ai_governance_mcp.context_engine.connectors.image")
@@ -47,10 +47,7 @@ class ImageConnector(BaseConnector):
         stat = file_path.stat()
         metadata_lines.append(f"Size: {stat.st_size} bytes")
         # Compute display path (relative to project root when available)
-        if project_root and file_path.is_relative_to(project_root):
-            display_path = str(file_path.relative_to(project_root))
-        else:
-            display_path = str(file_path)
+        display_path = relative_display_path(file_path, project_root)
         metadata_lines.append(f"Path: {display_path}")
 
         if self._pillow_available and file_path.suffix.lower() != ".svg":
@@ -7,7 +7,7 @@ Handles mixed text/image documents.
 import logging
 from pathlib import Path
 
-from .base import BaseConnector
+from .base import BaseConnector, relative_display_path
 from ..models import ContentChunk, FileMetadata
 
 logger = logging.getLogger("ai_governance_mcp.context_engine.connectors.pdf")
@@ -60,10 +60,7 @@ class PDFConnector(BaseConnector):
             return []
 
         # Compute display path (relative to project root when available)
-        if project_root and file_path.is_relative_to(project_root):
-            display_path = str(file_path.relative_to(project_root))
-        else:
-            display_path = str(file_path)
+        display_path = relative_display_path(file_path, project_root)
 
         chunks: list[ContentChunk] = []
 
@@ -132,6 +129,13 @@ class PDFConnector(BaseConnector):
                     for page_num in range(num_pages):
                         page = pdf.pages[page_num]
                         text = page.extract_text()
+                        # Drop the page's parsed layout (chars, objects) and
+                        # its textmap cache now; pdfplumber otherwise keeps
+                        # them for every page until the document closes, so
+                        # peak memory grows with pages. close() does both —
+                        # flush_cache() alone leaves the textmap cached.
+                        # Page.close() needs pdfplumber>=0.10.4 (our floor).
+                        page.close()
                         if text and len(text) > MAX_PAGE_TEXT_CHARS:
                             text = text[:MAX_PAGE_TEXT_CHARS]
                         if text and text.strip():
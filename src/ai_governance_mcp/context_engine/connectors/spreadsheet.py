@@ -8,7 +8,7 @@ import csv
 import logging
 from pathlib import Path
 
-from .base import BaseConnector
+from .base import BaseConnector, relative_display_path
 from ..models import ContentChunk, FileMetadata
 
 logger = logging.getLogger("ai_governance_mcp.context_engine.connectors.spreadsheet")
@@ -41,10 +41,7 @@ class SpreadsheetConnector(BaseConnector):
     ) -> list[ContentChunk]:
         """Parse a spreadsheet into schema + sample chunks."""
         # Compute display path (relative to project root when available)
-        if project_root and file_path.is_relative_to(project_root):
-            display_path = str(file_path.relative_to(project_root))
-        else:
-            display_path = str(file_path)
+        display_path = relative_display_path(file_path, project_root)
 
         suffix = file_path.suffix.lower()
         if suffix in {".csv", ".tsv"}:
@@ -6,21 +6,25 @@ generates embeddings, and builds the hybrid search index (BM25 + semantic).
 
 import hashlib
 import logging
+import os
 import re
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
 import pathspec
 
+from .bm25 import BM25Postings
 from .connectors.base import BaseConnector
 from .connectors.code import CodeConnector
 from .connectors.document import DocumentConnector
 from .connectors.image import ImageConnector
 from .connectors.pdf import PDFConnector
 from .connectors.spreadsheet import SpreadsheetConnector
-from .models import ContentChunk, FileMetadata, ProjectIndex
+from .models import ContentChunk, FileMetadata, ProjectIndex, validate_chunks
 from .storage.base import BaseStorage
 
 logger = logging.getLogger("ai_governance_mcp.context_engine.indexer")
@@ -44,6 +48,22 @@ MAX_CHUNK_CONTENT_CHARS = 10_000
 # accommodate larger models in the allowlist that can handle longer inputs.
 MAX_EMBEDDING_INPUT_CHARS = 6000
 
+# int8 embedding quantization: vectors are L2-normalized (components in
+# [-1, 1]), so a single global scale maps them onto the full int8 range
+INT8_EMBEDDING_SCALE = 127.0
+
+# Files modified this close to the last index are re-hashed even when
+# size+mtime match — covers coarse filesystem timestamps (FAT: 2s)
+RACY_MTIME_WINDOW_SECONDS = 2.0
+
+# Read size when streaming files through SHA-256 — 64 KiB cuts read calls
+# 8x versus 8 KiB; larger buffers measured no faster
+FILE_HASH_READ_SIZE = 64 * 1024
+
+# Worker threads for the independent artifact writes (chunks, embeddings,
+# BM25 corpus + postings, code edges) — their file I/O overlaps
+PERSIST_WORKERS = 3
+
 # Batch size for embedding generation — limits peak memory
 EMBEDDING_BATCH_SIZE = 1000
 
@@ -87,6 +107,22 @@ DEFAULT_IGNORE_PATTERNS = [
     "id_ed25519*",
 ]
 
+# Compiled once at import — reused for projects without an ignore file
+_DEFAULT_IGNORE_SPEC = pathspec.GitIgnoreSpec.from_lines(DEFAULT_IGNORE_PATTERNS)
+
+
+def quantize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """Quantize L2-normalized float embeddings to int8 (global scale 127)."""
+    scaled = np.rint(np.asarray(embeddings, dtype=np.float32) * INT8_EMBEDDING_SCALE)
+    return np.clip(scaled, -127, 127).astype(np.int8)
+
+
+def dequantize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """Return float32 embeddings; int8 input is rescaled, float input passes through."""
+    if embeddings.dtype == np.int8:
+        return embeddings.astype(np.float32) / INT8_EMBEDDING_SCALE
+    return embeddings
+
 
 class Indexer:
     """Core indexing orchestrator.
@@ -106,13 +142,18 @@ class Indexer:
         embedding_model: str = "BAAI/bge-small-en-v1.5",
         embedding_dimensions: int = 384,
         readonly: bool = False,
+        quantize_embeddings: bool = False,
     ) -> None:
         self.storage = storage
         self.embedding_model_name = embedding_model
         self.embedding_dimensions = embedding_dimensions
         self.readonly = readonly
+        # Persist embeddings as int8 (4x smaller on disk and in page cache)
+        self.quantize_embeddings = quantize_embeddings
         self._embedding_model = None
         self._model_lock = threading.Lock()  # Thread-safe lazy model loading
+        # Compiled ignore specs: project_path → (ignore file stat key, spec)
+        self._ignore_specs: dict[Path, tuple[tuple, pathspec.GitIgnoreSpec]] = {}
 
         # Initialize connectors in priority order
         self.connectors: list[BaseConnector] = [
@@ -144,8 +185,6 @@ class Indexer:
             if self._embedding_model is not None:
                 return self._embedding_model
 
-            import os
-
             # Phase 2: try IPC client first (socket file existence = fast-fail)
             if (
                 os.environ.get("AI_CONTEXT_ENGINE_EMBED_SOCKET", "").strip().lower()
@@ -165,15 +204,8 @@ class Indexer:
                 except Exception as e:
                     logger.debug("Indexer IPC client not available: %s", e)
 
-            # Fallback: local model
-            try:
-                from sentence_transformers import SentenceTransformer
-            except ImportError:
-                raise ImportError(
-                    "sentence-transformers not installed. "
-                    "Install with: pip install 'ai-governance-mcp[context-engine]'"
-                )
-
+            # Fallback: local model. Allowlist is checked before importing
+            # sentence-transformers so a rejected model never pays the import.
             allow_custom = os.environ.get(
                 "AI_CONTEXT_ENGINE_ALLOW_CUSTOM_MODELS", ""
             ).lower() in ("true", "1")
@@ -197,6 +229,14 @@ class Indexer:
                     self.embedding_model_name,
                 )
 
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers not installed. "
+                    "Install with: pip install 'ai-governance-mcp[context-engine]'"
+                )
+
             logger.info(
                 "Loading embedding model locally: %s (this may take a moment on first use)",
                 self.embedding_model_name,
@@ -232,6 +272,9 @@ class Indexer:
             )
         logger.info("Indexing project: %s (id: %s)", project_path, project_id)
 
+        # Taken before any file is stat'ed or hashed — see _current_hashes
+        scan_started_at = datetime.now(timezone.utc).isoformat()
+
         # Load ignore patterns
         ignore_patterns = self.load_ignore_patterns(project_path)
 
@@ -308,31 +351,11 @@ class Indexer:
             index_mode=index_mode,
             schema_version=1,
             chunking_version=self._get_chunking_version(),
+            scan_started_at=scan_started_at,
         )
 
-        # Persist to storage — ordered for crash safety:
-        # chunks → embeddings → bm25 → metadata → manifest LAST
-        # Manifest is the "commit record": if crash occurs before manifest
-        # write, next load sees old manifest and triggers full re-index.
-        self.storage.save_chunks(
-            project_id,
-            project_index.model_dump()["chunks"],
-        )
-        self.storage.save_embeddings(project_id, embeddings)
-        self.storage.save_bm25_index(project_id, bm25_data)
-        if code_edges is not None:
-            self.storage.save_code_edges(
-                project_id, [e.model_dump() for e in code_edges]
-            )
-
-        full_dump = project_index.model_dump()
-        full_dump.pop("chunks", None)
-        full_dump.pop("files", None)  # Already stored in file_manifest.json
-        self.storage.save_metadata(project_id, full_dump)
-
-        self.storage.save_file_manifest(
-            project_id,
-            {fm.path: fm.model_dump() for fm in all_metadata},
+        self._persist_index(
+            project_id, project_index, embeddings, bm25_data, code_edges, all_metadata
         )
 
         logger.info(
@@ -416,11 +439,12 @@ class Indexer:
             return self.index_project(project_path, project_id, index_mode)
 
         # Discover current files
+        scan_started_at = datetime.now(timezone.utc).isoformat()
         ignore_patterns = self.load_ignore_patterns(project_path)
         current_files = self._discover_files(project_path, ignore_patterns)
-        current_hashes = {}
-        for f in current_files:
-            current_hashes[str(f)] = self._file_hash(f)
+        current_hashes = self._current_hashes(
+            current_files, manifest, existing_metadata.get("scan_started_at")
+        )
 
         # Classify files
         unchanged, modified, added, deleted = self._classify_files(
@@ -526,29 +550,19 @@ class Indexer:
             index_mode=index_mode,
             schema_version=1,
             chunking_version=current_chunking_version,
+            scan_started_at=scan_started_at,
         )
 
         # Resolve code references with the full updated chunk set
         code_edges = self._resolve_code_references(project_path, all_chunks)
 
-        # Atomic save — ordered: chunks → embeddings → bm25 → edges → metadata → manifest LAST
-        self.storage.save_chunks(project_id, project_index.model_dump()["chunks"])
-        self.storage.save_embeddings(project_id, embeddings)
-        self.storage.save_bm25_index(project_id, bm25_data)
-        if code_edges is not None:
-            self.storage.save_code_edges(
-                project_id, [e.model_dump() for e in code_edges]
-            )
-
-        full_dump = project_index.model_dump()
-        full_dump.pop("chunks", None)
-        full_dump.pop("files", None)
-        self.storage.save_metadata(project_id, full_dump)
-
-        # Manifest LAST — serves as the "commit record"
-        self.storage.save_file_manifest(
+        self._persist_index(
             project_id,
-            {fm.path: fm.model_dump() for fm in all_file_metadata},
+            project_index,
+            embeddings,
+            bm25_data,
+            code_edges,
+            all_file_metadata,
         )
 
         logger.info(
@@ -560,6 +574,58 @@ class Indexer:
         )
         return project_index
 
+    def _persist_index(
+        self,
+        project_id: str,
+        project_index: ProjectIndex,
+        embeddings: np.ndarray,
+        bm25_data: dict,
+        code_edges: list | None,
+        file_metadata: list[FileMetadata],
+    ) -> None:
+        """Write all index artifacts for a project.
+
+        Crash-safety order: data artifacts → metadata → manifest LAST. The
+        manifest is the "commit record": if a crash occurs before it is
+        written, the next load sees the old manifest and triggers a full
+        re-index. The data artifacts don't depend on each other, so they are
+        written concurrently; every write must succeed before metadata and
+        the manifest follow. Each storage write is atomic (tmp + rename).
+        """
+        full_dump = project_index.model_dump()
+        chunk_dicts = full_dump.pop("chunks")
+        full_dump.pop("files", None)  # Already stored in file_manifest.json
+
+        writes = [
+            lambda: self.storage.save_chunks(project_id, chunk_dicts),
+            lambda: self.storage.save_embeddings(
+                project_id, self._stored_embeddings(embeddings)
+            ),
+            lambda: self.storage.save_bm25_index(project_id, bm25_data),
+            lambda: self.storage.save_bm25_postings(
+                project_id,
+                BM25Postings.from_corpus(bm25_data["tokenized_corpus"]).to_arrays(),
+            ),
+        ]
+        if code_edges is not None:
+            writes.append(
+                lambda: self.storage.save_code_edges(
+                    project_id, [e.model_dump() for e in code_edges]
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=PERSIST_WORKERS) as pool:
+            futures = [pool.submit(write) for write in writes]
+        # Re-raise the first failure before the commit records are written
+        for future in futures:
+            future.result()
+
+        self.storage.save_metadata(project_id, full_dump)
+        self.storage.save_file_manifest(
+            project_id,
+            {fm.path: fm.model_dump() for fm in file_metadata},
+        )
+
     def _get_chunking_version(self) -> str:
         """Return current chunking strategy identifier.
 
@@ -608,27 +674,31 @@ class Indexer:
             (unchanged_paths, modified_paths, added_paths, deleted_paths)
             unchanged and deleted are string paths, modified and added are Path objects.
         """
-        current_path_strs = {str(f) for f in current_files}
-        manifest_paths = set(manifest.keys())
+        # One str() per path and no copied manifest key set; lookups go
+        # straight to the dict. Output order follows current_files and the
+        # manifest, so deleted paths come back in a deterministic order.
+        path_strs = [str(f) for f in current_files]
+        current_path_strs = set(path_strs)
 
         unchanged = []
         modified = []
         added = []
 
-        for file_path in current_files:
-            path_str = str(file_path)
-            if path_str in manifest_paths:
-                stored_hash = manifest[path_str].get("content_hash")
-                current_hash = current_hashes.get(path_str, "")
-                # content_hash=None means legacy index — treat as MODIFIED
-                if stored_hash is not None and stored_hash == current_hash:
-                    unchanged.append(path_str)
-                else:
-                    modified.append(file_path)
-            else:
+        for file_path, path_str in zip(current_files, path_strs):
+            entry = manifest.get(path_str)
+            if entry is None:
                 added.append(file_path)
+                continue
+            stored_hash = entry.get("content_hash")
+            # content_hash=None means legacy index — treat as MODIFIED
+            if stored_hash is not None and stored_hash == current_hashes.get(
+                path_str, ""
+            ):
+                unchanged.append(path_str)
+            else:
+                modified.append(file_path)
 
-        deleted = [p for p in manifest_paths if p not in current_path_strs]
+        deleted = [p for p in manifest if p not in current_path_strs]
 
         return unchanged, modified, added, deleted
 
@@ -637,11 +707,12 @@ class Indexer:
         chunks_data: list[dict],
         unchanged_files: list[str],
         old_embeddings: np.ndarray,
-    ) -> tuple[list[ContentChunk], list[np.ndarray]]:
+    ) -> tuple[list[ContentChunk], np.ndarray]:
         """Collect chunks from unchanged files with their embedding vectors.
 
-        Returns chunks and vectors as aligned lists (same order).
-        Vector at index i corresponds to chunk at index i.
+        Returns chunks and vectors aligned in the same order: row i of the
+        vector matrix corresponds to chunk i. Rows are gathered from the old
+        matrix in one indexing operation rather than copied one at a time.
 
         Args:
             chunks_data: Raw chunk dicts from storage.
@@ -649,71 +720,81 @@ class Indexer:
             old_embeddings: Full embedding matrix from previous index.
 
         Returns:
-            (chunks, vectors) — aligned lists of unchanged chunks and their vectors.
+            (chunks, vectors) — unchanged chunks and their (n, dim) vector matrix.
         """
-        unchanged_set = set(unchanged_files)
-        chunks = []
-        vectors: list[np.ndarray] = []
+        # Chunks carry project-relative source paths while the manifest uses
+        # absolute ones. Index every path-component suffix of the unchanged
+        # files, so each chunk is one set lookup rather than a scan of all
+        # files, and "ta.py" can't match "/proj/data.py".
+        unchanged_keys: set[str] = set()
+        for uf in unchanged_files:
+            unchanged_keys.add(uf)
+            for i, ch in enumerate(uf):
+                if ch in "/\\":
+                    unchanged_keys.add(uf[i + 1 :])
+        unchanged_keys.discard("")
+
+        kept: list[dict] = []
+        row_ids: list[int] = []
 
         for chunk_dict in chunks_data:
-            source = chunk_dict.get("source_path", "")
-            # Match by source_path — chunks use relative paths while manifest
-            # uses absolute paths. Try both matching strategies.
-            is_unchanged = False
-            for uf in unchanged_set:
-                if uf.endswith(source) or source == uf:
-                    is_unchanged = True
-                    break
-
-            if is_unchanged:
-                chunk = ContentChunk(**chunk_dict)
-                old_id = chunk.embedding_id
+            if chunk_dict.get("source_path", "") in unchanged_keys:
+                old_id = chunk_dict.get("embedding_id")
                 if (
-                    old_id is not None
+                    isinstance(old_id, int)
                     and old_embeddings is not None
                     and 0 <= old_id < len(old_embeddings)
                 ):
-                    vectors.append(old_embeddings[old_id].copy())
-                    chunks.append(chunk)
+                    row_ids.append(old_id)
+                    kept.append(chunk_dict)
                 # Skip chunks without valid embedding (shouldn't happen, but safe)
 
-        return chunks, vectors
+        if old_embeddings is None:
+            vectors = np.zeros((0, self.embedding_dimensions), dtype=np.float32)
+        else:
+            # Fancy indexing already returns a copy, detached from the old matrix
+            rows = old_embeddings[np.asarray(row_ids, dtype=np.intp)]
+            vectors = dequantize_embeddings(rows).astype(np.float32, copy=False)
+
+        # Validate the kept chunks in one batch rather than one model per chunk
+        return validate_chunks(kept), vectors
 
     def _build_incremental_embeddings(
         self,
         all_chunks: list[ContentChunk],
         n_unchanged: int,
-        unchanged_vectors: list[np.ndarray],
+        unchanged_vectors: np.ndarray | list[np.ndarray],
     ) -> np.ndarray:
         """Build embedding matrix reusing old vectors for unchanged chunks.
 
         Unchanged vectors are placed at the start (positions 0..n_unchanged-1),
-        new embeddings are generated for the rest.
+        new embeddings are generated for the rest. The matrix is allocated once
+        and new batches are encoded straight into its tail rows.
 
         Args:
             all_chunks: Combined chunk list (unchanged first, then new).
             n_unchanged: Number of unchanged chunks at start of all_chunks.
-            unchanged_vectors: Pre-extracted vectors aligned with unchanged chunks.
+            unchanged_vectors: Pre-extracted vectors aligned with unchanged chunks
+                (an (n, dim) matrix or a list of rows).
 
         Returns:
             New embedding matrix with shape (len(all_chunks), dimensions).
         """
         if not all_chunks:
-            return np.zeros((0, self.embedding_dimensions))
+            return np.zeros((0, self.embedding_dimensions), dtype=np.float32)
 
         total = len(all_chunks)
         result = np.zeros((total, self.embedding_dimensions), dtype=np.float32)
 
         # Reuse old vectors for unchanged chunks (positions 0..n_unchanged-1)
-        for i, vec in enumerate(unchanged_vectors):
-            if i < n_unchanged:
-                result[i] = vec
+        n_reused = min(len(unchanged_vectors), n_unchanged)
+        if n_reused:
+            result[:n_reused] = np.asarray(unchanged_vectors[:n_reused])
 
         # Generate new embeddings only for new/modified chunks
         if n_unchanged < total:
             new_chunks = all_chunks[n_unchanged:]
-            new_embeddings = self._generate_embeddings(new_chunks)
-            result[n_unchanged:] = new_embeddings
+            self._generate_embeddings(new_chunks, out=result[n_unchanged:])
 
         logger.info(
             "Embeddings: %d reused, %d generated",
@@ -734,7 +815,7 @@ class Indexer:
         return ProjectIndex(
             project_id=project_id,
             project_path=str(project_path),
-            chunks=[ContentChunk(**cd) for cd in chunks_data],
+            chunks=validate_chunks(chunks_data),
             created_at=metadata.get("created_at", ""),
             updated_at=metadata.get("updated_at", ""),
             embedding_model=metadata.get("embedding_model", self.embedding_model_name),
@@ -743,6 +824,7 @@ class Indexer:
             index_mode=index_mode,
             schema_version=metadata.get("schema_version", 1),
             chunking_version=metadata.get("chunking_version", "line-based-v1"),
+            scan_started_at=metadata.get("scan_started_at"),
         )
 
     def load_ignore_patterns(self, project_path: Path) -> pathspec.GitIgnoreSpec:
@@ -750,6 +832,8 @@ class Indexer:
 
         Returns a compiled GitIgnoreSpec for efficient matching.
         Defaults come first so user patterns (including negation) take precedence.
+        The compiled spec is reused until the ignore file's size or mtime
+        changes, so watcher-driven incremental updates don't recompile it.
         """
         # Defaults first — user patterns can override with !pattern negation
         patterns = list(DEFAULT_IGNORE_PATTERNS)
@@ -758,6 +842,20 @@ class Indexer:
         gitignore = project_path / ".gitignore"
 
         source = contextignore if contextignore.exists() else gitignore
+        try:
+            st = source.stat()
+            key: tuple = (source.name, st.st_ino, st.st_size, st.st_mtime_ns)
+            # Same racy-timestamp guard as _current_hashes: a just-written file
+            # may be rewritten within the clock tick without changing its mtime
+            cacheable = (
+                time.time_ns() - st.st_mtime_ns > RACY_MTIME_WINDOW_SECONDS * 1e9
+            )
+        except OSError:
+            key, cacheable = (), True
+        cached = self._ignore_specs.get(project_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         if source.exists():
             try:
                 # Guard against oversized ignore files (1MB limit)
@@ -774,7 +872,15 @@ class Indexer:
             except OSError as e:
                 logger.warning("Failed to read %s: %s", source.name, e)
 
-        return pathspec.GitIgnoreSpec.from_lines(patterns)
+        if len(patterns) > len(DEFAULT_IGNORE_PATTERNS):
+            spec = pathspec.GitIgnoreSpec.from_lines(patterns)
+        else:
+            spec = _DEFAULT_IGNORE_SPEC
+        if cacheable:
+            self._ignore_specs[project_path] = (key, spec)
+        else:
+            self._ignore_specs.pop(project_path, None)
+        return spec
 
     def _discover_files(
         self, project_path: Path, ignore_spec: pathspec.GitIgnoreSpec
@@ -782,48 +888,70 @@ class Indexer:
         """Discover all indexable files in the project.
 
         Filters out symlinks, files exceeding size limit, and ignored patterns.
+        Walks with os.scandir so file/dir/symlink checks come from the cached
+        directory entry, and stops as soon as MAX_FILE_COUNT files are found.
+        Ignored directories are pruned without descending, unless the spec
+        has negation patterns that could re-include files beneath them.
         """
-        files = []
-        # Note: rglob does NOT follow directory symlinks (Python 3.4+, bpo-26012).
-        # File symlinks are filtered below. This is safe against symlink traversal attacks.
-        for file_path in project_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            # Skip symlinks to prevent traversal outside project
-            if file_path.is_symlink():
-                logger.debug("Skipping symlink: %s", file_path)
+        files: list[Path] = []
+        # An empty spec matches nothing — skip the per-entry match calls
+        has_patterns = bool(ignore_spec.patterns)
+        prune_dirs = has_patterns and not any(
+            p.include is False for p in ignore_spec.patterns
+        )
+        # Stack of (directory path, path relative to project root with "/")
+        stack: list[tuple[str, str]] = [(str(project_path), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.debug("Skipping unreadable directory %s: %s", dir_path, e)
                 continue
 
-            # Check against ignore patterns (gitignore semantics via pathspec)
-            rel_str = str(file_path.relative_to(project_path))
+            for entry in entries:
+                rel_str = rel_dir + entry.name
+                # Skip symlinks (files and directories) to prevent traversal
+                # outside the project
+                if entry.is_symlink():
+                    logger.debug("Skipping symlink: %s", entry.path)
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if not (prune_dirs and ignore_spec.match_file(rel_str + "/")):
+                        stack.append((entry.path, rel_str + "/"))
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
 
-            if ignore_spec.match_file(rel_str):
-                continue
+                # Check against ignore patterns (gitignore semantics via pathspec)
+                if has_patterns and ignore_spec.match_file(rel_str):
+                    continue
 
-            # Skip files exceeding size limit
-            try:
-                if file_path.stat().st_size > MAX_FILE_SIZE_BYTES:
-                    logger.info(
-                        "Skipping file exceeding %d byte limit: %s",
-                        MAX_FILE_SIZE_BYTES,
-                        rel_str,
-                    )
+                # Skip files exceeding size limit
+                try:
+                    if entry.stat(follow_symlinks=False).st_size > MAX_FILE_SIZE_BYTES:
+                        logger.info(
+                            "Skipping file exceeding %d byte limit: %s",
+                            MAX_FILE_SIZE_BYTES,
+                            rel_str,
+                        )
+                        continue
+                except OSError:
                     continue
-            except OSError:
-                continue
 
-            # Check if any connector can handle this file
-            if self._get_connector(file_path) is not None:
-                files.append(file_path)
+                # Check if any connector can handle this file
+                file_path = Path(entry.path)
+                if self._get_connector(file_path) is not None:
+                    files.append(file_path)
 
-            # Enforce file count limit
-            if len(files) >= MAX_FILE_COUNT:
-                logger.warning(
-                    "File count limit reached (%d). Remaining files skipped.",
-                    MAX_FILE_COUNT,
-                )
-                break
+                # Enforce file count limit
+                if len(files) >= MAX_FILE_COUNT:
+                    logger.warning(
+                        "File count limit reached (%d). Remaining files skipped.",
+                        MAX_FILE_COUNT,
+                    )
+                    return sorted(files)
 
         return sorted(files)
 
@@ -834,25 +962,91 @@ class Indexer:
                 return connector
         return None
 
+    def _current_hashes(
+        self,
+        current_files: list[Path],
+        manifest: dict,
+        scan_started_at: str | None,
+    ) -> dict[str, str]:
+        """Content hashes for current files, skipping reads for unchanged stats.
+
+        Two-tier check: if a file's (size, mtime) still match its manifest
+        entry, the stored content_hash is reused without opening the file;
+        otherwise the file is hashed. Files whose mtime falls within
+        RACY_MTIME_WINDOW_SECONDS of the previous scan's start are always
+        hashed, since a same-size edit in the same timestamp tick as that
+        scan's stat would be invisible to stat. The guard is anchored to the
+        scan start, not updated_at — a long parse/embed run would otherwise
+        push the trust boundary past racily stat'ed files.
+
+        Args:
+            current_files: Currently discovered file paths.
+            manifest: Stored file manifest {abs_path: metadata_dict}.
+            scan_started_at: ISO timestamp taken before the previous index
+                stat'ed and hashed its files (metadata scan_started_at).
+                None — e.g. indexes written before it was recorded — hashes
+                every file.
+
+        Returns:
+            {abs_path_str: sha256_hash} for every current file.
+        """
+        trust_before = None
+        if scan_started_at:
+            try:
+                trust_before = (
+                    datetime.fromisoformat(scan_started_at).timestamp()
+                    - RACY_MTIME_WINDOW_SECONDS
+                )
+            except ValueError:
+                pass
+
+        hashes: dict[str, str] = {}
+        for file_path in current_files:
+            path_str = str(file_path)
+            entry = manifest.get(path_str)
+            if trust_before is not None and entry and entry.get("content_hash"):
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    st = None
+                if (
+                    st is not None
+                    and st.st_size == entry.get("size_bytes")
+                    and st.st_mtime == entry.get("last_modified")
+                    and st.st_mtime < trust_before
+                ):
+                    hashes[path_str] = entry["content_hash"]
+                    continue
+            hashes[path_str] = self._file_hash(file_path)
+        return hashes
+
     def _file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of file content."""
         hasher = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
+                while chunk := f.read(FILE_HASH_READ_SIZE):
                     hasher.update(chunk)
         except OSError:
             return ""
         return hasher.hexdigest()
 
-    def _generate_embeddings(self, chunks: list[ContentChunk]) -> np.ndarray:
+    def _generate_embeddings(
+        self, chunks: list[ContentChunk], out: np.ndarray | None = None
+    ) -> np.ndarray:
         """Generate embeddings in batches to limit peak memory.
 
         Instead of passing all texts to encode() at once (which can spike
         memory for large projects), processes in batches of EMBEDDING_BATCH_SIZE.
+
+        Args:
+            chunks: Chunks to embed.
+            out: Optional (len(chunks), dim) float32 slice of a larger matrix
+                to write into, so callers assembling a combined matrix avoid
+                a second allocation and copy.
         """
         if not chunks:
-            return np.zeros((0, self.embedding_dimensions))
+            return np.zeros((0, self.embedding_dimensions), dtype=np.float32)
 
         texts = []
         for chunk in chunks:
@@ -862,22 +1056,51 @@ class Indexer:
                 text = chunk.content
             texts.append(text[:MAX_EMBEDDING_INPUT_CHARS])
 
-        # Batch to limit peak memory
-        all_embeddings = []
+        # Identical inputs (empty __init__.py files, license headers,
+        # generated boilerplate) embed identically — encode each distinct
+        # text once and gather rows back into chunk order
+        unique_ids: dict[str, int] = {}
+        inverse = np.fromiter(
+            (unique_ids.setdefault(t, len(unique_ids)) for t in texts),
+            dtype=np.intp,
+            count=len(texts),
+        )
+        if len(unique_ids) == len(texts):
+            return self._encode_batches(texts, out)
+        unique_embeddings = self._encode_batches(list(unique_ids), None)
+        if out is None:
+            return unique_embeddings[inverse]
+        np.take(unique_embeddings, inverse, axis=0, out=out)
+        return out
+
+    def _encode_batches(self, texts: list[str], out: np.ndarray | None) -> np.ndarray:
+        """Encode texts in EMBEDDING_BATCH_SIZE batches into one float32 matrix."""
+        # Batch to limit peak memory; each batch is written straight into one
+        # preallocated matrix (sized from the first batch's width) instead of
+        # collecting per-batch arrays and concatenating them at the end
+        embeddings: np.ndarray | None = out
         for i in range(0, len(texts), EMBEDDING_BATCH_SIZE):
             batch = texts[i : i + EMBEDDING_BATCH_SIZE]
-            batch_embeddings = self.embedding_model.encode(
-                batch,
-                show_progress_bar=False,
-                normalize_embeddings=True,
+            batch_embeddings = np.asarray(
+                self.embedding_model.encode(
+                    batch,
+                    show_progress_bar=False,
+                    normalize_embeddings=True,
+                )
             )
-            all_embeddings.append(np.array(batch_embeddings))
+            if embeddings is None:
+                embeddings = np.empty(
+                    (len(texts), batch_embeddings.shape[1]), dtype=np.float32
+                )
+            embeddings[i : i + len(batch)] = batch_embeddings
 
-        return (
-            np.vstack(all_embeddings)
-            if all_embeddings
-            else np.zeros((0, self.embedding_dimensions))
-        )
+        return embeddings
+
+    def _stored_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
+        """Apply the configured on-disk encoding (int8 when quantizing)."""
+        if self.quantize_embeddings:
+            return quantize_embeddings(embeddings)
+        return embeddings
 
     def _build_bm25_index(self, chunks: list[ContentChunk]) -> dict:
         """Build BM25 index data from content chunks.
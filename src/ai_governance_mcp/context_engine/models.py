@@ -6,7 +6,7 @@ query results, and code graph edges used throughout the context engine.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 # Valid content types for chunks and file metadata
 ContentType = Literal["code", "document", "data", "image"]
@@ -62,6 +62,34 @@ class ContentChunk(BaseModel):
     embedding_id: int | None = Field(None, description="Index into embeddings array")
 
 
+_CONTENT_CHUNK_LIST = TypeAdapter(list[ContentChunk])
+
+
+def validate_chunks(data: list[dict]) -> list[ContentChunk]:
+    """Validate stored chunk dicts in one pydantic-core call.
+
+    Roughly 2x faster than ``[ContentChunk(**d) for d in data]`` on large
+    indexes — the per-item Python call overhead disappears.
+
+    Repeated ``source_path``/``language`` strings are deduplicated in place
+    first (pydantic keeps the str object), so every chunk of a file shares
+    one string instead of holding its own copy from the JSON decoder.
+    ``content_type`` needs no help: Literal validation already returns the
+    shared literal.
+    """
+    if isinstance(data, list):
+        seen: dict[str, str] = {}
+        for item in data:
+            # Malformed items are left for pydantic to reject
+            if not isinstance(item, dict):
+                continue
+            for key in ("source_path", "language"):
+                value = item.get(key)
+                if isinstance(value, str):
+                    item[key] = seen.setdefault(value, value)
+    return _CONTENT_CHUNK_LIST.validate_python(data)
+
+
 class FileMetadata(BaseModel):
     """Metadata about an indexed file."""
 
@@ -112,6 +140,12 @@ class ProjectIndex(BaseModel):
         description="Parser strategy identifier (e.g., 'line-based-v1', 'tree-sitter-v1'). "
         "Mismatch triggers full re-index in incremental path.",
     )
+    scan_started_at: str | None = Field(
+        None,
+        description="ISO timestamp taken before this index's files were stat'ed "
+        "and hashed; only mtimes safely before it are trusted by the incremental "
+        "size+mtime check. None (older indexes) means every file is re-hashed.",
+    )
 
 
 class QueryResult(BaseModel):
@@ -6,19 +6,22 @@ to route queries to the correct project index.
 """
 
 import logging
+import os
 import re
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal
 import numpy as np
-from rank_bm25 import BM25Okapi
+from pydantic import ValidationError
 
 from ..embedding_ipc import EmbeddingClient
 from ..path_resolution import looks_like_project
 
-from .indexer import Indexer
+from .bm25 import BM25Postings
+from .indexer import INT8_EMBEDDING_SCALE, Indexer, dequantize_embeddings
 from .models import (
     ContentChunk,
     IndexMode,
@@ -26,6 +29,7 @@ from .models import (
     ProjectQueryResult,
     ProjectStatus,
     QueryResult,
+    validate_chunks,
 )
 from .cognee_adapter import CogneeAdapter
 from .storage.base import BaseStorage
@@ -68,16 +72,71 @@ MMR_LAMBDA = 0.7
 # RRF fusion constant (Cormack et al., 2009)
 RRF_K = 60
 
+# list_projects cache only trusts index-dir mtimes at least this old (1s)
+STATUS_CACHE_MIN_AGE_NS = 1_000_000_000
 
-def _build_bm25(corpus: list[list[str]]) -> BM25Okapi | None:
-    """Build a BM25 index from a tokenized corpus, with empty-corpus guard.
+# Rows of an int8 embedding matrix widened to float32 per scoring block
+INT8_SCORE_BLOCK_ROWS = 16_384
 
-    BM25Okapi raises ZeroDivisionError on empty or all-empty-document corpus.
-    Returns None if the corpus is unusable.
+# Recent query embeddings kept (LRU) — agents often repeat or re-run queries
+QUERY_EMBEDDING_CACHE_SIZE = 128
+
+
+def embedding_options_from_env() -> dict:
+    """Read the embedding settings shared by every ProjectManager from env.
+
+    The MCP server and the watcher daemon both write the same indexes, so
+    they must embed and store vectors identically; both build their
+    ProjectManager with these keyword arguments.
+
+    Environment variables:
+        AI_CONTEXT_ENGINE_EMBEDDING_MODEL: Model name (default: BAAI/bge-small-en-v1.5)
+        AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS: Integer dimensions (default: 384)
+        AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT: Float 0.0-1.0 (default: 0.7)
+        AI_CONTEXT_ENGINE_QUANTIZE_EMBEDDINGS: 'true' stores embeddings as int8 (default: false)
+
+    Returns:
+        Keyword arguments for ProjectManager.
     """
-    if corpus and any(len(doc) > 0 for doc in corpus):
-        return BM25Okapi(corpus)
-    return None
+    embedding_model = os.environ.get(
+        "AI_CONTEXT_ENGINE_EMBEDDING_MODEL", "BAAI/bge-small-en-v1.5"
+    )
+
+    try:
+        embedding_dimensions = int(
+            os.environ.get("AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS", "384")
+        )
+        if embedding_dimensions <= 0:
+            raise ValueError("must be positive")
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            "Invalid AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS: %s. Using default 384.",
+            e,
+        )
+        embedding_dimensions = 384
+
+    try:
+        semantic_weight = float(
+            os.environ.get("AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT", "0.7")
+        )
+        semantic_weight = max(0.0, min(1.0, semantic_weight))
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            "Invalid AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT: %s. Using default 0.7.",
+            e,
+        )
+        semantic_weight = 0.7
+
+    quantize_embeddings = os.environ.get(
+        "AI_CONTEXT_ENGINE_QUANTIZE_EMBEDDINGS", ""
+    ).strip().lower() in ("true", "1")
+
+    return {
+        "embedding_model": embedding_model,
+        "embedding_dimensions": embedding_dimensions,
+        "semantic_weight": semantic_weight,
+        "quantize_embeddings": quantize_embeddings,
+    }
 
 
 class ProjectManager:
@@ -101,6 +160,7 @@ class ProjectManager:
         readonly: bool = False,
         reranking: bool = True,
         fusion_method: Literal["linear", "rrf"] = "linear",
+        quantize_embeddings: bool = False,
     ) -> None:
         self.storage = storage or FilesystemStorage()
         self.embedding_model_name = embedding_model
@@ -116,18 +176,30 @@ class ProjectManager:
             embedding_model=embedding_model,
             embedding_dimensions=embedding_dimensions,
             readonly=readonly,
+            quantize_embeddings=quantize_embeddings,
         )
         self._watchers: dict[str, FileWatcher] = {}
         self._loaded_indexes: dict[str, ProjectIndex] = {}
         self._loaded_embeddings: dict[str, np.ndarray] = {}
-        self._loaded_bm25: dict[str, BM25Okapi] = {}
+        self._loaded_bm25: dict[str, BM25Postings] = {}
         self._loaded_code_edges: dict[str, list[dict]] = {}
+        # Query-independent ranking inputs, rebuilt when the index object changes:
+        # project_id → (index, recency map) and
+        # project_id → (chunks, recency map, (type_bonus, last_modified, fm_rows))
+        self._recency_maps: dict[str, tuple[ProjectIndex, dict[str, float]]] = {}
+        self._bonus_columns: dict[str, tuple] = {}
+        # Query text → flat float32 embedding (LRU, QUERY_EMBEDDING_CACHE_SIZE)
+        self._query_embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        # list_projects cache: project_id → (index dir mtime_ns, metadata, size)
+        self._status_cache: dict[str, tuple[int, dict, int]] = {}
 
         # LRU tracking: list of project_ids ordered by last access (most recent last)
         self._access_order: list[str] = []
 
         # RLock protects shared index state from watcher callback mutations.
         # Reentrant because query_project may call get_or_create_index internally.
+        # threading.RLock is the C _thread.RLock (~100ns uncontended), which is
+        # negligible next to index work, so no third-party lock is warranted.
         self._index_lock = threading.RLock()
 
         # Track consecutive watcher failures per project for circuit breaker
@@ -388,9 +460,9 @@ class ProjectManager:
             project_id = FilesystemStorage.project_id_from_path(project_path)
 
             # Stop existing watcher if any
-            if project_id in self._watchers:
-                self._watchers[project_id].stop()
-                del self._watchers[project_id]
+            watcher = self._watchers.pop(project_id, None)
+            if watcher is not None:
+                watcher.stop()
 
             # Increment generation — any in-flight watcher callbacks will
             # detect the mismatch and discard their stale results
@@ -402,6 +474,8 @@ class ProjectManager:
             self._loaded_embeddings.pop(project_id, None)
             self._loaded_bm25.pop(project_id, None)
             self._loaded_code_edges.pop(project_id, None)
+            self._recency_maps.pop(project_id, None)
+            self._bonus_columns.pop(project_id, None)
 
             # Re-index — use default_index_mode (from env var) rather than only
             # stored metadata, so env var changes take effect on reindex
@@ -445,7 +519,7 @@ class ProjectManager:
 
         try:
             chunks_data = self.storage.load_chunks(project_id)
-            chunks = [ContentChunk(**c) for c in chunks_data] if chunks_data else []
+            chunks = validate_chunks(chunks_data) if chunks_data else []
         except Exception as exc:
             raise ValueError(f"Failed to load chunks for KG build: {exc}") from exc
 
@@ -501,7 +575,8 @@ class ProjectManager:
             return "disabled"
         if project_id in self._circuit_broken:
             return "circuit_broken"
-        if project_id in self._watchers and self._watchers[project_id].is_running:
+        watcher = self._watchers.get(project_id)
+        if watcher is not None and watcher.is_running:
             return "running"
         # Distinguish: project not loaded into memory yet vs watcher stopped
         if project_id not in self._loaded_indexes:
@@ -509,16 +584,47 @@ class ProjectManager:
         return "stopped"
 
     def list_projects(self) -> list[ProjectStatus]:
-        """List all indexed projects with their status."""
+        """List all indexed projects with their status.
+
+        Metadata and index size are cached per project, keyed by the index
+        directory's mtime. Every storage write is a tmp + rename, which bumps
+        the directory mtime, so unchanged projects skip the metadata.json
+        read and size scan. Watcher status is always computed fresh.
+        """
         statuses = []
-        for project_id in self.storage.list_projects():
+        project_ids = self.storage.list_projects()
+        for project_id in project_ids:
             try:
-                metadata = self.storage.load_metadata(project_id)
-                if metadata:
-                    statuses.append(self._build_project_status(project_id, metadata))
+                stamp = self.storage.get_index_path(project_id).stat().st_mtime_ns
+                cached = self._status_cache.get(project_id)
+                if cached is not None and cached[0] == stamp:
+                    _, metadata, index_size = cached
+                else:
+                    metadata = self.storage.load_metadata(project_id)
+                    if not metadata:
+                        self._status_cache.pop(project_id, None)
+                        continue
+                    index_size = self._compute_index_size(project_id)
+                    # Directory mtimes come from a coarse clock — two writes in
+                    # one tick share a stamp, so only trust settled stamps
+                    if time.time_ns() - stamp > STATUS_CACHE_MIN_AGE_NS:
+                        self._status_cache[project_id] = (stamp, metadata, index_size)
+                    else:
+                        self._status_cache.pop(project_id, None)
+                statuses.append(
+                    self._build_project_status(
+                        project_id, metadata, index_size=index_size
+                    )
+                )
             except (OSError, ValueError, KeyError) as e:
                 logger.warning("Error loading project %s: %s", project_id, e)
                 continue
+
+        # Drop entries for deleted projects
+        live = set(project_ids)
+        for project_id in list(self._status_cache):
+            if project_id not in live:
+                self._status_cache.pop(project_id, None)
         return statuses
 
     def get_project_status(
@@ -622,19 +728,11 @@ class ProjectManager:
         project_id: str,
         metadata: dict,
         project_path: Path | None = None,
+        index_size: int | None = None,
     ) -> ProjectStatus:
         """Build a ProjectStatus from metadata with error-safe index size."""
-        index_path = self.storage.get_index_path(project_id)
-        index_size = 0
-        if index_path.exists():
-            try:
-                index_size = sum(
-                    f.stat().st_size
-                    for f in index_path.iterdir()
-                    if f.is_file() and not f.is_symlink()
-                )
-            except OSError as e:
-                logger.warning("Error computing index size for %s: %s", project_id, e)
+        if index_size is None:
+            index_size = self._compute_index_size(project_id)
 
         index_mode = metadata.get("index_mode", "ondemand")
         with self._index_lock:
@@ -653,6 +751,24 @@ class ProjectManager:
             watcher_status=watcher_status,
         )
 
+    def _compute_index_size(self, project_id: str) -> int:
+        """Total bytes of regular files in a project's index directory."""
+        index_path = self.storage.get_index_path(project_id)
+        index_size = 0
+        if index_path.exists():
+            try:
+                # scandir: file type comes from the directory entry, so only
+                # the size needs a stat() call (iterdir needed three per file)
+                with os.scandir(index_path) as entries:
+                    index_size = sum(
+                        entry.stat(follow_symlinks=False).st_size
+                        for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                    )
+            except OSError as e:
+                logger.warning("Error computing index size for %s: %s", project_id, e)
+        return index_size
+
     def _touch_project(self, project_id: str) -> None:
         """Mark a project as recently accessed for LRU eviction.
 
@@ -682,6 +798,8 @@ class ProjectManager:
             self._loaded_embeddings.pop(evict_id, None)
             self._loaded_bm25.pop(evict_id, None)
             self._loaded_code_edges.pop(evict_id, None)
+            self._recency_maps.pop(evict_id, None)
+            self._bonus_columns.pop(evict_id, None)
             logger.info("Evicted project %s from memory (LRU)", evict_id)
 
     def _load_project(self, project_id: str) -> ProjectIndex:
@@ -700,24 +818,31 @@ class ProjectManager:
 
         # Load chunks from dedicated file (new format)
         chunks_data = self.storage.load_chunks(project_id)
-        if chunks_data is not None:
-            metadata["chunks"] = chunks_data
-        # else: metadata may still contain chunks from old format — use as-is
 
         try:
-            index = ProjectIndex(**metadata)
-        except Exception as e:
+            if not isinstance(metadata, dict):
+                raise TypeError(
+                    f"metadata is a JSON {type(metadata).__name__}, not an object"
+                )
+            if chunks_data is not None:
+                # Batch-validate chunks in one pydantic-core call; the model
+                # then accepts the ContentChunk instances without revalidating
+                metadata["chunks"] = validate_chunks(chunks_data)
+            # else: metadata may still contain chunks from old format — use as-is
+            index = ProjectIndex.model_validate(metadata)
+        except (ValidationError, TypeError) as e:
             logger.warning(
                 "Corrupt metadata for project %s, creating empty index: %s",
                 project_id,
                 e,
             )
+            fields = metadata if isinstance(metadata, dict) else {}
             index = ProjectIndex(
                 project_id=project_id,
-                project_path=metadata.get("project_path", "unknown"),
-                created_at=metadata.get("created_at", "unknown"),
-                updated_at=metadata.get("updated_at", "unknown"),
-                embedding_model=metadata.get("embedding_model", "unknown"),
+                project_path=fields.get("project_path", "unknown"),
+                created_at=fields.get("created_at", "unknown"),
+                updated_at=fields.get("updated_at", "unknown"),
+                embedding_model=fields.get("embedding_model", "unknown"),
             )
         # Warn if stored embedding model differs from configured model.
         # Mismatched embeddings produce garbage similarity scores — disable
@@ -739,35 +864,38 @@ class ProjectManager:
         return index
 
     def _load_search_indexes(self, project_id: str) -> None:
-        """Load embeddings and BM25 index for a project.
+        """Load embeddings and code edges for a project.
+
+        BM25 postings are loaded lazily by _get_bm25 on the first keyword
+        query, so projects that are only listed or inspected never pay for them.
 
         Respects embedding model mismatch: if _load_project discarded
         embeddings due to model mismatch, this method will not reload them.
-        Also validates embeddings/chunks length consistency.
+        Also validates that the embeddings are a matrix with one row per chunk.
+        The width is not checked against embedding_dimensions: that setting
+        defaults to 384 even for larger allowed models, and the stored index
+        records only the model name (checked in _load_project).
         """
         # Skip embedding reload if they were discarded due to model mismatch
         if project_id not in self._loaded_embeddings:
             embeddings = self.storage.load_embeddings(project_id)
             if embeddings is not None:
-                # A1 FIX: Validate embeddings/chunks length consistency
+                # A1 FIX: Validate embeddings/chunks length consistency; also
+                # rejects 1-D arrays that would fail inside the search dot product
                 index = self._loaded_indexes.get(project_id)
-                if index and len(embeddings) != len(index.chunks):
+                if index is not None and (
+                    embeddings.ndim != 2 or len(embeddings) != len(index.chunks)
+                ):
                     logger.warning(
-                        "Embeddings/chunks length mismatch for %s "
-                        "(%d embeddings vs %d chunks). Discarding embeddings.",
+                        "Embeddings/chunks shape mismatch for %s "
+                        "(%s embeddings vs %d chunks). Discarding embeddings.",
                         project_id,
-                        len(embeddings),
+                        embeddings.shape,
                         len(index.chunks),
                     )
                 else:
                     self._loaded_embeddings[project_id] = embeddings
 
-        bm25_data = self.storage.load_bm25_index(project_id)
-        if bm25_data and bm25_data.get("tokenized_corpus"):
-            bm25 = _build_bm25(bm25_data["tokenized_corpus"])
-            if bm25 is not None:
-                self._loaded_bm25[project_id] = bm25
-
         code_edges = self.storage.load_code_edges(project_id)
         if code_edges is not None:
             self._loaded_code_edges[project_id] = code_edges
@@ -777,43 +905,119 @@ class ProjectManager:
 
         Falls back to empty results (BM25-only) if the embedding model
         fails to load, preventing a single model failure from breaking
-        all queries.
+        all queries. Query embeddings are reused for repeated query text;
+        the model is fixed per manager, so a cached vector never goes stale.
         """
         embeddings = self._loaded_embeddings.get(project_id)
         if embeddings is None or len(embeddings) == 0:
             return np.array([])
 
-        try:
-            query_embedding = self._indexer.embedding_model.encode(
-                [query], normalize_embeddings=True
-            )
-        except Exception as e:
+        query_vector = self._query_embeddings.get(query)
+        if query_vector is None:
+            try:
+                encoded = self._indexer.embedding_model.encode(
+                    [query], normalize_embeddings=True
+                )
+            except Exception as e:
+                logger.warning(
+                    "Embedding model failed for query, falling back to BM25-only: %s",
+                    e,
+                )
+                return np.array([])
+            query_vector = np.asarray(encoded, dtype=np.float32).reshape(-1)
+            query_vector.flags.writeable = False
+            self._query_embeddings[query] = query_vector
+            if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        else:
+            self._query_embeddings.move_to_end(query)
+
+        if embeddings.shape[1] != len(query_vector):
             logger.warning(
-                "Embedding model failed for query, falling back to BM25-only: %s", e
+                "Embedding width %d for %s does not match the query model's %d; "
+                "falling back to BM25-only. Re-index to fix.",
+                embeddings.shape[1],
+                project_id,
+                len(query_vector),
             )
             return np.array([])
 
-        scores = np.dot(embeddings, query_embedding.T).flatten()
-        # Clip to [0, 1]
-        scores = np.clip(scores, 0.0, 1.0)
+        if embeddings.dtype == np.int8:
+            scores = self._int8_scores(embeddings, query_vector)
+        else:
+            # Matrix-vector product (GEMV) against the flat query vector
+            scores = embeddings @ query_vector
+        # Clip to [0, 1] — scores is a fresh array, so clip in place
+        np.clip(scores, 0.0, 1.0, out=scores)
         return scores
 
+    @staticmethod
+    def _int8_scores(embeddings: np.ndarray, query_embedding: np.ndarray) -> np.ndarray:
+        """Cosine scores against int8-quantized embeddings.
+
+        NumPy has no int8 GEMM, so rows are widened to float32 one block at a
+        time — peak scratch memory stays at INT8_SCORE_BLOCK_ROWS rows while
+        the stored matrix (and its page-cache footprint) stays 4x smaller.
+        The query stays float32; only the corpus side is quantized.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        scores = np.empty(len(embeddings), dtype=np.float32)
+        for start in range(0, len(embeddings), INT8_SCORE_BLOCK_ROWS):
+            block = embeddings[start : start + INT8_SCORE_BLOCK_ROWS]
+            scores[start : start + len(block)] = block.astype(np.float32) @ query
+        return scores / INT8_EMBEDDING_SCALE
+
+    def _load_bm25(self, project_id: str) -> BM25Postings | None:
+        """Load BM25 postings from storage, or build them from the legacy corpus.
+
+        Indexes written before postings were persisted (or with an outdated
+        postings layout) only have bm25_index.json — rebuild from its
+        tokenized corpus so they keep working until the next re-index.
+        """
+        arrays = self.storage.load_bm25_postings(project_id)
+        if arrays is not None:
+            try:
+                return BM25Postings.from_arrays(arrays)
+            except ValueError as e:
+                logger.info(
+                    "BM25 postings unusable for %s, rebuilding from corpus: %s",
+                    project_id,
+                    e,
+                )
+
+        bm25_data = self.storage.load_bm25_index(project_id)
+        if bm25_data and bm25_data.get("tokenized_corpus"):
+            return BM25Postings.from_corpus(bm25_data["tokenized_corpus"])
+        return None
+
+    def _get_bm25(self, project_id: str) -> BM25Postings | None:
+        """Return the cached BM25 scorer for a loaded project, loading on first use."""
+        bm25 = self._loaded_bm25.get(project_id)
+        if bm25 is None and project_id in self._loaded_indexes:
+            bm25 = self._load_bm25(project_id)
+            if bm25 is not None:
+                self._loaded_bm25[project_id] = bm25
+        return bm25
+
     def _bm25_search(self, query: str, project_id: str) -> np.ndarray:
         """Perform BM25 keyword search, returning per-chunk scores."""
-        bm25 = self._loaded_bm25.get(project_id)
+        bm25 = self._get_bm25(project_id)
         if bm25 is None:
             return np.array([])
 
         tokenized_query = re.findall(r"\w+", query.lower())
         scores = bm25.get_scores(tokenized_query)
 
-        # Normalize to [0, 1]. BM25 IDF can produce negative scores for
-        # very common terms in small corpora — clip after normalization.
+        # Normalize to [0, 1] by the max score. BM25 IDF can produce negative
+        # scores for very common terms in small corpora — floor them at 0.
+        # Values are already <= 1 after the divide, so one output array and a
+        # max/multiply/maximum pass replace divide + two-sided clip.
         max_score = scores.max() if len(scores) > 0 else 0.0
-        if max_score > 0:
-            scores = scores / max_score
-        scores = np.clip(scores, 0.0, 1.0)
-        return scores
+        if max_score <= 0:
+            return np.zeros(len(scores))
+        normalized = np.multiply(scores, 1.0 / max_score)
+        np.maximum(normalized, 0.0, out=normalized)
+        return normalized
 
     @staticmethod
     def _classify_file_type(source_path: str) -> str:
@@ -869,35 +1073,6 @@ class ProjectManager:
 
         return "other"
 
-    @staticmethod
-    def _compute_recency_bonus(
-        source_path: str, file_recency_map: dict[str, float] | None
-    ) -> float:
-        """Compute recency bonus for a chunk based on file modification time.
-
-        Args:
-            source_path: Relative path from the chunk.
-            file_recency_map: {relative_path: last_modified_timestamp} or None.
-
-        Returns:
-            Bonus: +0.01 for recent, -0.01 for stale, 0.0 otherwise.
-        """
-        if file_recency_map is None:
-            return 0.0
-
-        last_mod = file_recency_map.get(source_path)
-        if last_mod is None:
-            return 0.0
-
-        age_seconds = time.time() - last_mod
-        age_days = age_seconds / 86400
-
-        if age_days <= RECENCY_RECENT_DAYS:
-            return RECENCY_RECENT_BONUS
-        elif age_days > RECENCY_STALE_DAYS:
-            return RECENCY_STALE_PENALTY
-        return 0.0
-
     def _build_file_recency_map(self, project_id: str) -> dict[str, float] | None:
         """Build {relative_path: last_modified} map from loaded index.
 
@@ -907,6 +1082,9 @@ class ProjectManager:
         index = self._loaded_indexes.get(project_id)
         if index is None or not index.files:
             return None
+        cached = self._recency_maps.get(project_id)
+        if cached is not None and cached[0] is index:
+            return cached[1]
 
         project_root = index.project_path
         recency_map: dict[str, float] = {}
@@ -919,6 +1097,7 @@ class ProjectManager:
                 rel = abs_path
             recency_map[rel] = fm.last_modified
 
+        self._recency_maps[project_id] = (index, recency_map)
         return recency_map
 
     @staticmethod
@@ -1070,16 +1249,18 @@ class ProjectManager:
                 if emb_idx < 0 or emb_idx >= len(embeddings):
                     mmr_score = results[i].combined_score
                 else:
-                    candidate_emb = embeddings[emb_idx]
+                    # int8 rows must be widened before dot (int8 dot overflows)
+                    candidate_emb = dequantize_embeddings(embeddings[emb_idx])
                     max_sim = 0.0
                     for sel_idx in selected_emb_indices:
                         if sel_idx >= len(embeddings):
                             continue
+                        selected_emb = dequantize_embeddings(embeddings[sel_idx])
                         sim = float(
-                            np.dot(candidate_emb, embeddings[sel_idx])
+                            np.dot(candidate_emb, selected_emb)
                             / (
                                 np.linalg.norm(candidate_emb)
-                                * np.linalg.norm(embeddings[sel_idx])
+                                * np.linalg.norm(selected_emb)
                                 + 1e-10
                             )
                         )
@@ -1107,22 +1288,75 @@ class ProjectManager:
 
         return selected
 
+    def _bonus_columns_for(
+        self,
+        chunks: list[ContentChunk],
+        file_recency_map: dict[str, float] | None,
+        project_id: str | None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Query-independent per-chunk columns used by _compute_bonuses.
+
+        Returns (file-type bonus, last_modified or NaN, indices of chunks with
+        frontmatter). Cached per project while the same chunk list and recency
+        map are in use, so queries skip per-chunk path classification.
+        """
+        if project_id is not None:
+            cached = self._bonus_columns.get(project_id)
+            if (
+                cached is not None
+                and cached[0] is chunks
+                and cached[1] is file_recency_map
+            ):
+                return cached[2]
+
+        n = len(chunks)
+        type_bonus = np.empty(n)
+        last_modified = np.full(n, np.nan)
+        frontmatter_rows = []
+        for i, chunk in enumerate(chunks):
+            file_type = self._classify_file_type(chunk.source_path)
+            type_bonus[i] = FILE_TYPE_BONUSES.get(file_type, 0.0)
+            if file_recency_map is not None:
+                last_mod = file_recency_map.get(chunk.source_path)
+                if last_mod is not None:
+                    last_modified[i] = last_mod
+            if chunk.frontmatter:
+                frontmatter_rows.append(i)
+
+        columns = (
+            type_bonus,
+            last_modified,
+            np.array(frontmatter_rows, dtype=np.intp),
+        )
+        if project_id is not None:
+            self._bonus_columns[project_id] = (chunks, file_recency_map, columns)
+        return columns
+
     def _compute_bonuses(
         self,
         chunks: list[ContentChunk],
         file_recency_map: dict[str, float] | None,
         query_lower: str,
+        project_id: str | None = None,
     ) -> np.ndarray:
         """Compute per-chunk bonuses (file type, recency, metadata)."""
-        n = len(chunks)
-        bonuses = np.zeros(n)
-        for i, chunk in enumerate(chunks):
-            file_type = self._classify_file_type(chunk.source_path)
-            bonuses[i] = FILE_TYPE_BONUSES.get(file_type, 0.0)
-            bonuses[i] += self._compute_recency_bonus(
-                chunk.source_path, file_recency_map
-            )
-            bonuses[i] += self._compute_metadata_bonus(chunk, query_lower)
+        type_bonus, last_modified, frontmatter_rows = self._bonus_columns_for(
+            chunks, file_recency_map, project_id
+        )
+        bonuses = type_bonus.copy()
+
+        # Recency: +bonus within RECENCY_RECENT_DAYS, penalty past
+        # RECENCY_STALE_DAYS; unknown (NaN) ages compare False and get 0.0
+        age_days = (time.time() - last_modified) / 86400
+        bonuses += np.where(
+            age_days <= RECENCY_RECENT_DAYS,
+            RECENCY_RECENT_BONUS,
+            np.where(age_days > RECENCY_STALE_DAYS, RECENCY_STALE_PENALTY, 0.0),
+        )
+
+        # Metadata bonus depends on the query but is 0.0 without frontmatter
+        for i in frontmatter_rows:
+            bonuses[i] += self._compute_metadata_bonus(chunks[i], query_lower)
         return bonuses
 
     @staticmethod
@@ -1152,6 +1386,24 @@ class ProjectManager:
         combined = rrf_norm + bonuses
         return np.clip(combined, 0.0, 1.0)
 
+    @staticmethod
+    def _iter_top_indices(scores: np.ndarray, k: int):
+        """Yield indices in descending score order, partial-sorting the head.
+
+        The first k come from argpartition (O(n)) + a sort of just those k;
+        the remainder is only sorted if the caller keeps consuming (e.g. many
+        heading-only chunks were skipped).
+        """
+        n = len(scores)
+        if k >= n:
+            yield from np.argsort(-scores, kind="stable")
+            return
+        head = np.argpartition(-scores, k - 1)[:k]
+        head = head[np.argsort(-scores[head], kind="stable")]
+        yield from head
+        rest = np.setdiff1d(np.arange(n), head, assume_unique=True)
+        yield from rest[np.argsort(-scores[rest], kind="stable")]
+
     def _fuse_scores(
         self,
         chunks: list[ContentChunk],
@@ -1172,18 +1424,19 @@ class ProjectManager:
         sem = semantic_scores if len(semantic_scores) == n else np.zeros(n)
         kw = keyword_scores if len(keyword_scores) == n else np.zeros(n)
 
-        bonuses = self._compute_bonuses(chunks, file_recency_map, query_lower)
+        bonuses = self._compute_bonuses(
+            chunks, file_recency_map, query_lower, project_id
+        )
 
         if self.fusion_method == "rrf":
             combined = self._combine_rrf(sem, kw, bonuses)
         else:
             combined = self._combine_linear(sem, kw, bonuses, self.semantic_weight)
 
-        top_indices = np.argsort(combined)[::-1]
-
         # Build candidate pool — cap at 50 to bound downstream O(n²) operations
         # (reranking uses top-20, MMR is greedy O(n²), dedup further reduces)
         candidate_cap = max(50, max_results * 5)
+        top_indices = self._iter_top_indices(combined, 2 * candidate_cap)
         results = []
         chunk_indices = []
         for idx in top_indices:
@@ -1240,12 +1493,7 @@ class ProjectManager:
                 )
                 # Load search data from storage (disk I/O, still outside lock)
                 new_embeddings = self.storage.load_embeddings(project_id)
-                new_bm25_data = self.storage.load_bm25_index(project_id)
-                new_bm25 = _build_bm25(
-                    new_bm25_data["tokenized_corpus"]
-                    if new_bm25_data and new_bm25_data.get("tokenized_corpus")
-                    else []
-                )
+                new_bm25 = self._load_bm25(project_id)
                 new_code_edges = self.storage.load_code_edges(project_id)
 
                 # Brief lock: swap in-memory structures atomically
@@ -35,7 +35,7 @@ from mcp.types import TextContent, Tool
 
 from ..path_resolution import is_within_allowed_scope, looks_like_project
 from .cognee_adapter import CogneeAdapter
-from .project_manager import ProjectManager
+from .project_manager import ProjectManager, embedding_options_from_env
 
 logger = logging.getLogger("ai_governance_mcp.context_engine.server")
 
@@ -52,7 +52,7 @@ MAX_LOG_CONTENT_LENGTH = 2000
 _INDEX_RATE_LIMIT_TOKENS = 5.0
 _INDEX_RATE_LIMIT_REFILL_RATE = 5 / 60  # 5 per minute
 _index_rate_tokens = _INDEX_RATE_LIMIT_TOKENS
-_index_rate_last_refill = time.time()
+_index_rate_last_refill = time.monotonic()
 _rate_limit_lock = threading.Lock()
 
 
@@ -67,12 +67,17 @@ def _check_index_rate_limit() -> bool:
     separate Claude Code windows) each maintain independent rate limits.
     Distributed rate limiting would require external coordination (Redis,
     filesystem lock, etc.) — not implemented for v1 simplicity.
+
+    The lock is held for a few arithmetic ops on an admission path that
+    allows 5 calls a minute; contention is not a cost worth a lock-free
+    design. Refill uses the monotonic clock so wall-clock adjustments can
+    neither refill the bucket early nor starve it.
     """
     global _index_rate_tokens, _index_rate_last_refill
 
     with _rate_limit_lock:
-        now = time.time()
-        elapsed = now - _index_rate_last_refill
+        now = time.monotonic()
+        elapsed = max(0.0, now - _index_rate_last_refill)
         _index_rate_last_refill = now
 
         _index_rate_tokens = min(
@@ -86,6 +91,35 @@ def _check_index_rate_limit() -> bool:
         return False
 
 
+# Error sanitization rules, compiled once at import (applied in order).
+# Module paths require an alphabetic start per segment so version numbers
+# and IPs (3.10.0, 192.168.1.1) are left intact.
+_ERROR_SANITIZE_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    # Absolute paths (keep only filename): Unix, Windows (C:\), paths with spaces
+    (
+        re.compile(r'(?:[A-Za-z]:)?(?:[/\\][^/\\:*?"<>|\n]+)+[/\\]([^/\\:*?"<>|\s]+)'),
+        r"\1",
+    ),
+    # Relative path traversals (../../etc/passwd)
+    (re.compile(r'(?:\.\.[/\\])+([^/\\:*?"<>|\s]+)'), r"\1"),
+    # Windows UNC paths (\\server\share\file.txt)
+    (
+        re.compile(r'\\\\[^\\:*?"<>|\s]+(?:\\[^\\:*?"<>|\s]+)*\\([^\\:*?"<>|\s]+)'),
+        r"\1",
+    ),
+    # Line numbers from tracebacks
+    (re.compile(r", line \d+"), ""),
+    # Memory addresses
+    (re.compile(r"0x[0-9a-fA-F]+"), "0x***"),
+    # Python module paths (e.g., "foo.bar.baz.function")
+    (re.compile(r"\b[A-Za-z_]\w*(?:\.[A-Za-z_]\w*){2,}\b"), "[module]"),
+    # Function references in tracebacks
+    (re.compile(r"\bin\s+\w+\s*\("), "in [func]("),
+    # Stack frame references
+    (re.compile(r'File\s+["\'][^"\']+["\']'), "File [redacted]"),
+)
+
+
 def _sanitize_error_message(error: Exception) -> str:
     """Sanitize error message to prevent information leakage.
 
@@ -94,44 +128,8 @@ def _sanitize_error_message(error: Exception) -> str:
     returning to client.
     """
     message = str(error)
-
-    # Remove absolute paths (keep only filename)
-    # Handles Unix paths, Windows paths (C:\), and paths with spaces in quotes
-    message = re.sub(
-        r'(?:[A-Za-z]:)?(?:[/\\][^/\\:*?"<>|\n]+)+[/\\]([^/\\:*?"<>|\s]+)',
-        r"\1",
-        message,
-    )
-
-    # Remove relative path traversals (../../etc/passwd)
-    message = re.sub(
-        r'(?:\.\.[/\\])+([^/\\:*?"<>|\s]+)',
-        r"\1",
-        message,
-    )
-
-    # Remove Windows UNC paths (\\server\share\file.txt)
-    message = re.sub(
-        r'\\\\[^\\:*?"<>|\s]+(?:\\[^\\:*?"<>|\s]+)*\\([^\\:*?"<>|\s]+)',
-        r"\1",
-        message,
-    )
-
-    # Remove line numbers from tracebacks
-    message = re.sub(r", line \d+", "", message)
-
-    # Remove memory addresses
-    message = re.sub(r"0x[0-9a-fA-F]+", "0x***", message)
-
-    # Remove Python module paths (e.g., "foo.bar.baz.function")
-    # Require alphabetic start per segment to avoid matching version numbers/IPs
-    message = re.sub(r"\b[A-Za-z_]\w*(?:\.[A-Za-z_]\w*){2,}\b", "[module]", message)
-
-    # Remove function references in tracebacks
-    message = re.sub(r"\bin\s+\w+\s*\(", "in [func](", message)
-
-    # Remove stack frame references
-    message = re.sub(r'File\s+["\'][^"\']+["\']', "File [redacted]", message)
+    for pattern, replacement in _ERROR_SANITIZE_RULES:
+        message = pattern.sub(replacement, message)
 
     # Truncate very long messages
     max_error_length = 500
@@ -301,43 +299,19 @@ def _detect_readonly_mode(base_path: Path | None = None) -> bool:
 def _create_project_manager() -> ProjectManager:
     """Create and configure the project manager from environment.
 
+    Runs once per server process (from create_server); the parsed values
+    live on the ProjectManager, so request paths never re-read the
+    environment. Deliberately uncached so tests can patch os.environ.
+
+    Embedding settings (model, dimensions, semantic weight, int8
+    quantization) come from embedding_options_from_env, shared with the
+    watcher daemon.
+
     Environment variables:
-        AI_CONTEXT_ENGINE_EMBEDDING_MODEL: Model name (default: BAAI/bge-small-en-v1.5)
-        AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS: Integer dimensions (default: 384)
-        AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT: Float 0.0-1.0 (default: 0.7)
         AI_CONTEXT_ENGINE_INDEX_PATH: Custom index storage path (default: ~/.context-engine/indexes/)
         AI_CONTEXT_ENGINE_INDEX_MODE: 'ondemand' (default) or 'realtime' (enables file watcher)
         AI_CONTEXT_ENGINE_READONLY: 'true', 'false', or 'auto' (default: auto)
     """
-    embedding_model = os.environ.get(
-        "AI_CONTEXT_ENGINE_EMBEDDING_MODEL", "BAAI/bge-small-en-v1.5"
-    )
-
-    try:
-        embedding_dimensions = int(
-            os.environ.get("AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS", "384")
-        )
-        if embedding_dimensions <= 0:
-            raise ValueError("must be positive")
-    except (ValueError, TypeError) as e:
-        logger.warning(
-            "Invalid AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS: %s. Using default 384.",
-            e,
-        )
-        embedding_dimensions = 384
-
-    try:
-        semantic_weight = float(
-            os.environ.get("AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT", "0.7")
-        )
-        semantic_weight = max(0.0, min(1.0, semantic_weight))
-    except (ValueError, TypeError) as e:
-        logger.warning(
-            "Invalid AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT: %s. Using default 0.7.",
-            e,
-        )
-        semantic_weight = 0.7
-
     index_path = os.environ.get("AI_CONTEXT_ENGINE_INDEX_PATH")
     if index_path:
         resolved = Path(index_path).resolve()
@@ -387,250 +361,252 @@ def _create_project_manager() -> ProjectManager:
 
     return ProjectManager(
         storage=storage,
-        embedding_model=embedding_model,
-        embedding_dimensions=embedding_dimensions,
-        semantic_weight=semantic_weight,
         default_index_mode=default_index_mode,
         readonly=readonly,
+        **embedding_options_from_env(),
     )
 
 
-def create_server() -> tuple[Server, ProjectManager]:
-    """Create and configure the MCP server with all tools."""
-    server = Server("context-engine", instructions=SERVER_INSTRUCTIONS)
-    manager = _create_project_manager()
-
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="query_project",
-                description=(
-                    "Default search tool — search source code, documentation, "
-                    "tests, and configuration using semantic + keyword matching. "
-                    "Finds conceptually related code and patterns even when "
-                    "naming differs. Preferred over Grep for discovery, "
-                    "exploration, and 'does X exist?' queries. "
-                    "Use Grep only for exact-string lookup in a known file, "
-                    "regex patterns, counting occurrences, or verifying "
-                    "a specific line number. "
-                    "Returns ranked results with file paths and line numbers."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": (
-                                "Natural language query or keyword search. "
-                                "Examples: 'where do we handle authentication?', "
-                                "'validate_token function', 'error handling patterns'"
-                            ),
-                            "minLength": 1,
-                            "maxLength": MAX_QUERY_LENGTH,
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum results to return (default: 10)",
-                            "default": 10,
-                            "minimum": 1,
-                            "maximum": 50,
-                        },
-                        "project_path": {
-                            "type": "string",
-                            "description": (
-                                "Absolute path to the project directory to query. "
-                                "Required for web clients (Claude.ai). "
-                                "Optional in CLI where CWD is the project. "
-                                "Call list_projects to discover paths."
-                            ),
-                        },
-                        "metadata_filter": {
-                            "type": "string",
-                            "description": (
-                                "Filter results by YAML frontmatter metadata. "
-                                "Format: 'key:value' pairs separated by spaces. "
-                                "Example: 'status:current tags:testing domain:ai-coding'. "
-                                "Only chunks with matching frontmatter are returned."
-                            ),
-                            "maxLength": 200,
-                        },
-                    },
-                    "required": ["query"],
+# Tool definitions are static — build (and pydantic-validate) them once at
+# import instead of on every list_tools request
+_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="query_project",
+        description=(
+            "Default search tool — search source code, documentation, "
+            "tests, and configuration using semantic + keyword matching. "
+            "Finds conceptually related code and patterns even when "
+            "naming differs. Preferred over Grep for discovery, "
+            "exploration, and 'does X exist?' queries. "
+            "Use Grep only for exact-string lookup in a known file, "
+            "regex patterns, counting occurrences, or verifying "
+            "a specific line number. "
+            "Returns ranked results with file paths and line numbers."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": (
+                        "Natural language query or keyword search. "
+                        "Examples: 'where do we handle authentication?', "
+                        "'validate_token function', 'error handling patterns'"
+                    ),
+                    "minLength": 1,
+                    "maxLength": MAX_QUERY_LENGTH,
                 },
-            ),
-            Tool(
-                name="index_project",
-                description=(
-                    "Trigger a full re-index of the current project. "
-                    "Use when: files have changed and index may be stale, "
-                    "or after initial project setup."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": (
-                                "Absolute path to the project directory to index. "
-                                "Required for web clients (Claude.ai). "
-                                "Optional in CLI where CWD is the project. "
-                                "Call list_projects to discover paths."
-                            ),
-                        },
-                    },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum results to return (default: 10)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
                 },
-            ),
-            Tool(
-                name="list_projects",
-                description="Show all indexed projects with basic stats.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
+                "project_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to the project directory to query. "
+                        "Required for web clients (Claude.ai). "
+                        "Optional in CLI where CWD is the project. "
+                        "Call list_projects to discover paths."
+                    ),
                 },
-            ),
-            Tool(
-                name="project_status",
-                description=(
-                    "Get detailed index statistics for the current project: "
-                    "file count, chunk count, last updated, index size, "
-                    "watcher status, and embedding model."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": (
-                                "Absolute path to the project directory. "
-                                "Required for web clients (Claude.ai). "
-                                "Optional in CLI where CWD is the project. "
-                                "Call list_projects to discover paths."
-                            ),
-                        },
-                    },
+                "metadata_filter": {
+                    "type": "string",
+                    "description": (
+                        "Filter results by YAML frontmatter metadata. "
+                        "Format: 'key:value' pairs separated by spaces. "
+                        "Example: 'status:current tags:testing domain:ai-coding'. "
+                        "Only chunks with matching frontmatter are returned."
+                    ),
+                    "maxLength": 200,
                 },
-            ),
-            Tool(
-                name="find_references",
-                description=(
-                    "Find code references for a symbol — who imports it, "
-                    "calls it, or extends it. Returns structural relationships "
-                    "from the code reference graph built during indexing."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "symbol": {
-                            "type": "string",
-                            "description": (
-                                "Symbol name to find references for. "
-                                "Examples: 'CodeConnector', 'parse', 'BaseStorage'"
-                            ),
-                            "minLength": 1,
-                            "maxLength": 200,
-                        },
-                        "project_path": {
-                            "type": "string",
-                            "description": (
-                                "Absolute path to the project directory. "
-                                "Required for web clients (Claude.ai). "
-                                "Optional in CLI where CWD is the project."
-                            ),
-                        },
-                        "direction": {
-                            "type": "string",
-                            "enum": ["callers", "callees", "all"],
-                            "description": (
-                                "Direction of references: 'callers' (who references this symbol), "
-                                "'callees' (what this symbol references), or 'all' (both). "
-                                "Default: 'all'."
-                            ),
-                            "default": "all",
-                        },
-                    },
-                    "required": ["symbol"],
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="index_project",
+        description=(
+            "Trigger a full re-index of the current project. "
+            "Use when: files have changed and index may be stale, "
+            "or after initial project setup."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to the project directory to index. "
+                        "Required for web clients (Claude.ai). "
+                        "Optional in CLI where CWD is the project. "
+                        "Call list_projects to discover paths."
+                    ),
                 },
-            ),
-            Tool(
-                name="build_knowledge_graph",
-                description=(
-                    "Build a knowledge graph for the current project using Cognee. "
-                    "Extracts entities and relationships from indexed content via LLM. "
-                    "IMPORTANT: This uses LLM calls with real cost — default provider "
-                    "is LM Studio or Ollama (free/local). Cloud providers (anthropic, openai) "
-                    "incur API charges. Configure model via AI_CONTEXT_ENGINE_COGNEE_* "
-                    "env vars (see README for model recommendations). "
-                    "Requires project to be indexed first via index_project."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": (
-                                "Absolute path to the project directory. "
-                                "Required for web clients (Claude.ai). "
-                                "Optional in CLI where CWD is the project."
-                            ),
-                        },
-                    },
+            },
+        },
+    ),
+    Tool(
+        name="list_projects",
+        description="Show all indexed projects with basic stats.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="project_status",
+        description=(
+            "Get detailed index statistics for the current project: "
+            "file count, chunk count, last updated, index size, "
+            "watcher status, and embedding model."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to the project directory. "
+                        "Required for web clients (Claude.ai). "
+                        "Optional in CLI where CWD is the project. "
+                        "Call list_projects to discover paths."
+                    ),
                 },
-            ),
-            Tool(
-                name="query_knowledge_graph",
-                description=(
-                    "Query the knowledge graph for entity and relationship information. "
-                    "Requires build_knowledge_graph to have been run first. "
-                    "Use for: entity relationships, concept connections, "
-                    "structural knowledge that semantic search might miss."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": (
-                                "Natural language query about entities, "
-                                "relationships, or concepts in the project."
-                            ),
-                            "minLength": 1,
-                            "maxLength": MAX_QUERY_LENGTH,
-                        },
-                        "search_type": {
-                            "type": "string",
-                            "enum": [
-                                "GRAPH_COMPLETION",
-                                "SUMMARIES",
-                                "INSIGHTS",
-                                "CHUNKS",
-                            ],
-                            "description": (
-                                "Type of knowledge graph search. "
-                                "Default: GRAPH_COMPLETION."
-                            ),
-                            "default": "GRAPH_COMPLETION",
-                        },
-                        "top_k": {
-                            "type": "integer",
-                            "description": "Maximum results (default: 10)",
-                            "default": 10,
-                            "minimum": 1,
-                            "maximum": 50,
-                        },
-                        "project_path": {
-                            "type": "string",
-                            "description": (
-                                "Absolute path to the project directory. "
-                                "Required for web clients (Claude.ai). "
-                                "Optional in CLI where CWD is the project."
-                            ),
-                        },
-                    },
-                    "required": ["query"],
+            },
+        },
+    ),
+    Tool(
+        name="find_references",
+        description=(
+            "Find code references for a symbol — who imports it, "
+            "calls it, or extends it. Returns structural relationships "
+            "from the code reference graph built during indexing."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": (
+                        "Symbol name to find references for. "
+                        "Examples: 'CodeConnector', 'parse', 'BaseStorage'"
+                    ),
+                    "minLength": 1,
+                    "maxLength": 200,
                 },
-            ),
-        ]
+                "project_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to the project directory. "
+                        "Required for web clients (Claude.ai). "
+                        "Optional in CLI where CWD is the project."
+                    ),
+                },
+                "direction": {
+                    "type": "string",
+                    "enum": ["callers", "callees", "all"],
+                    "description": (
+                        "Direction of references: 'callers' (who references this symbol), "
+                        "'callees' (what this symbol references), or 'all' (both). "
+                        "Default: 'all'."
+                    ),
+                    "default": "all",
+                },
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="build_knowledge_graph",
+        description=(
+            "Build a knowledge graph for the current project using Cognee. "
+            "Extracts entities and relationships from indexed content via LLM. "
+            "IMPORTANT: This uses LLM calls with real cost — default provider "
+            "is LM Studio or Ollama (free/local). Cloud providers (anthropic, openai) "
+            "incur API charges. Configure model via AI_CONTEXT_ENGINE_COGNEE_* "
+            "env vars (see README for model recommendations). "
+            "Requires project to be indexed first via index_project."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to the project directory. "
+                        "Required for web clients (Claude.ai). "
+                        "Optional in CLI where CWD is the project."
+                    ),
+                },
+            },
+        },
+    ),
+    Tool(
+        name="query_knowledge_graph",
+        description=(
+            "Query the knowledge graph for entity and relationship information. "
+            "Requires build_knowledge_graph to have been run first. "
+            "Use for: entity relationships, concept connections, "
+            "structural knowledge that semantic search might miss."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": (
+                        "Natural language query about entities, "
+                        "relationships, or concepts in the project."
+                    ),
+                    "minLength": 1,
+                    "maxLength": MAX_QUERY_LENGTH,
+                },
+                "search_type": {
+                    "type": "string",
+                    "enum": [
+                        "GRAPH_COMPLETION",
+                        "SUMMARIES",
+                        "INSIGHTS",
+                        "CHUNKS",
+                    ],
+                    "description": (
+                        "Type of knowledge graph search. Default: GRAPH_COMPLETION."
+                    ),
+                    "default": "GRAPH_COMPLETION",
+                },
+                "top_k": {
+                    "type": "integer",
+                    "description": "Maximum results (default: 10)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "project_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to the project directory. "
+                        "Required for web clients (Claude.ai). "
+                        "Optional in CLI where CWD is the project."
+                    ),
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+)
+
+
+def create_server() -> tuple[Server, ProjectManager]:
+    """Create and configure the MCP server with all tools."""
+    server = Server("context-engine", instructions=SERVER_INSTRUCTIONS)
+    manager = _create_project_manager()
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return list(_TOOLS)
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -39,6 +39,16 @@ class BaseStorage(ABC):
     def load_bm25_index(self, project_id: str) -> Any | None:
         """Load BM25 keyword index for a project."""
 
+    @abstractmethod
+    def save_bm25_postings(
+        self, project_id: str, arrays: dict[str, np.ndarray]
+    ) -> None:
+        """Save precomputed BM25 postings (plain arrays) for a project."""
+
+    @abstractmethod
+    def load_bm25_postings(self, project_id: str) -> dict[str, np.ndarray] | None:
+        """Load precomputed BM25 postings for a project."""
+
     @abstractmethod
     def save_metadata(self, project_id: str, metadata: dict) -> None:
         """Save project metadata (config, stats)."""
@@ -14,6 +14,7 @@ import logging
 import os
 import re
 import shutil
+import stat
 import threading
 from pathlib import Path
 from typing import Any
@@ -22,6 +23,11 @@ import numpy as np
 
 from .base import BaseStorage
 
+try:
+    import orjson
+except ImportError:  # optional (context-engine extra) — stdlib json fallback
+    orjson = None
+
 logger = logging.getLogger("ai_governance_mcp.context_engine.storage.filesystem")
 
 
@@ -55,6 +61,42 @@ def _atomic_write_json(path: Path, data: Any, indent: int | None = None) -> None
     tmp_path.replace(path)  # Atomic on POSIX
 
 
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file, using orjson when it is installed.
+
+    orjson is strict JSON, but json.dump writes NaN/Infinity and integers
+    wider than 64 bits — which YAML frontmatter (``.inf``, ``.nan``, huge
+    ints) carries into stored chunks. Input orjson rejects is re-parsed with
+    json.loads, so results match the stdlib either way. orjson.JSONDecodeError
+    subclasses json.JSONDecodeError, so callers only need to catch the latter.
+    """
+    data = path.read_bytes()
+    if orjson is None:
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _ensure_private_dir(path: Path) -> None:
+    """Create a directory (and parents) with mode 0o700.
+
+    Permissions are tightened even if the directory pre-existed with a
+    weaker mode. The common case — already a 0o700 directory — costs one
+    stat instead of mkdir + is_dir + chmod on every save.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if stat.S_ISDIR(st.st_mode) and stat.S_IMODE(st.st_mode) == 0o700:
+            return
+    path.mkdir(parents=True, exist_ok=True, mode=0o700)
+    os.chmod(path, 0o700)
+
+
 def _validate_project_id(project_id: str) -> None:
     """Validate project_id is hex-only to prevent path traversal.
 
@@ -73,6 +115,7 @@ class FilesystemStorage(BaseStorage):
             {project_hash}/
                 content_embeddings.npy
                 bm25_index.json
+                bm25_postings.npz
                 metadata.json
                 chunks.json
                 file_manifest.json
@@ -82,6 +125,11 @@ class FilesystemStorage(BaseStorage):
         - Path containment checked before write/delete operations
         - JSON serialization only (no pickle — prevents RCE)
         - NumPy loaded with allow_pickle=False
+
+    Embeddings are opened with mmap_mode="r": the loaded array is a
+    read-only np.memmap backed by the page cache, so resident memory for
+    idle projects stays bounded. Writers replace the file via rename, so
+    an existing mapping keeps seeing the old inode until it is dropped.
     """
 
     def __init__(self, base_path: Path | None = None) -> None:
@@ -94,9 +142,7 @@ class FilesystemStorage(BaseStorage):
         if base_path is None:
             base_path = Path.home() / ".context-engine" / "indexes"
         self.base_path = base_path.resolve()
-        self.base_path.mkdir(parents=True, exist_ok=True, mode=0o700)
-        # Ensure permissions even if directory pre-existed with weaker mode
-        os.chmod(self.base_path, 0o700)
+        _ensure_private_dir(self.base_path)
         # Clean up orphaned .tmp files from previous crashes
         self._cleanup_tmp_files()
 
@@ -125,6 +171,11 @@ class FilesystemStorage(BaseStorage):
 
         Uses SHA-256 hash of the absolute path, truncated to 16 chars.
         Output is guaranteed hex-only.
+
+        The ID is the on-disk index directory name, so the hash must stay
+        stable across releases — changing it orphans every existing index
+        (and read-only environments cannot migrate them). Cost is dominated
+        by Path.resolve() syscalls, not the hash (~1µs for a path string).
         """
         abs_path = str(project_path.resolve())
         return hashlib.sha256(abs_path.encode()).hexdigest()[:16]
@@ -135,16 +186,19 @@ class FilesystemStorage(BaseStorage):
         Validates project_id and checks path containment.
         """
         _validate_project_id(project_id)
-        path = (self.base_path / project_id).resolve()
-        if not path.is_relative_to(self.base_path):
+        # Runs before every load/save: resolve and check containment on
+        # strings (base_path is already resolved) rather than through
+        # Path.resolve() + is_relative_to(), which re-parse path objects.
+        base = str(self.base_path)
+        resolved = os.path.realpath(os.path.join(base, project_id))
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        if not resolved.startswith(prefix):
             raise ValueError("Path traversal detected")
-        return path
+        return Path(resolved)
 
     def _ensure_dir(self, project_id: str) -> Path:
         path = self.get_index_path(project_id)
-        path.mkdir(parents=True, exist_ok=True, mode=0o700)
-        # Ensure permissions even if directory pre-existed with weaker mode
-        os.chmod(path, 0o700)
+        _ensure_private_dir(path)
         return path
 
     def save_embeddings(self, project_id: str, embeddings: np.ndarray) -> None:
@@ -167,7 +221,10 @@ class FilesystemStorage(BaseStorage):
         actual_tmp.replace(final_path)  # Atomic on POSIX
 
     def load_embeddings(self, project_id: str) -> np.ndarray | None:
-        """Load embeddings with corrupt-file recovery.
+        """Load embeddings (memory-mapped) with corrupt-file recovery.
+
+        Returns a read-only np.memmap; callers that need to mutate rows
+        must copy them first.
 
         If the .npy file is corrupted (e.g., partial write from a crash),
         logs a warning and returns None so the caller can fall back to
@@ -176,7 +233,7 @@ class FilesystemStorage(BaseStorage):
         path = self.get_index_path(project_id) / "content_embeddings.npy"
         if path.exists():
             try:
-                return np.load(path, allow_pickle=False)
+                return np.load(path, mmap_mode="r", allow_pickle=False)
             except Exception as e:
                 logger.warning(
                     "Corrupt embeddings file for project %s, removing: %s",
@@ -207,8 +264,7 @@ class FilesystemStorage(BaseStorage):
                 )
                 return None
             try:
-                with open(json_path) as f:
-                    return json.load(f)
+                return _read_json(json_path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt BM25 index for project %s, removing: %s",
@@ -222,6 +278,41 @@ class FilesystemStorage(BaseStorage):
                 return None
         return None
 
+    def save_bm25_postings(
+        self, project_id: str, arrays: dict[str, np.ndarray]
+    ) -> None:
+        """Save precomputed BM25 postings atomically as an uncompressed .npz.
+
+        Same tmp + rename pattern as save_embeddings (np.savez appends .npz).
+        """
+        path = self._ensure_dir(project_id)
+        final_path = path / "bm25_postings.npz"
+        suffix = f"{os.getpid()}.{threading.get_ident()}"
+        tmp_path = path / f"bm25_postings.{suffix}.tmp"
+        np.savez(tmp_path, **arrays)
+        actual_tmp = tmp_path.with_suffix(".tmp.npz")
+        actual_tmp.replace(final_path)  # Atomic on POSIX
+
+    def load_bm25_postings(self, project_id: str) -> dict[str, np.ndarray] | None:
+        """Load precomputed BM25 postings with corrupt-file recovery."""
+        path = self.get_index_path(project_id) / "bm25_postings.npz"
+        if path.exists():
+            try:
+                with np.load(path, allow_pickle=False) as npz:
+                    return {key: npz[key] for key in npz.files}
+            except Exception as e:
+                logger.warning(
+                    "Corrupt BM25 postings for project %s, removing: %s",
+                    project_id,
+                    e,
+                )
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+                return None
+        return None
+
     def save_metadata(self, project_id: str, metadata: dict) -> None:
         path = self._ensure_dir(project_id)
         _atomic_write_json(path / "metadata.json", metadata, indent=2)
@@ -238,8 +329,7 @@ class FilesystemStorage(BaseStorage):
                 )
                 return None
             try:
-                with open(path) as f:
-                    return json.load(f)
+                return _read_json(path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt metadata for project %s, removing: %s",
@@ -275,8 +365,7 @@ class FilesystemStorage(BaseStorage):
                 )
                 return None
             try:
-                with open(json_path) as f:
-                    return json.load(f)
+                return _read_json(json_path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt chunks file for project %s, removing: %s",
@@ -305,8 +394,7 @@ class FilesystemStorage(BaseStorage):
                 )
                 return None
             try:
-                with open(json_path) as f:
-                    return json.load(f)
+                return _read_json(json_path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt code edges file for project %s, removing: %s",
@@ -336,8 +424,7 @@ class FilesystemStorage(BaseStorage):
                 )
                 return None
             try:
-                with open(path) as f:
-                    return json.load(f)
+                return _read_json(path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt file manifest for project %s, removing: %s",
@@ -357,16 +444,20 @@ class FilesystemStorage(BaseStorage):
         return path.exists() and (path / "metadata.json").exists()
 
     def list_projects(self) -> list[str]:
-        if not self.base_path.exists():
+        # DirEntry type checks come from the directory listing (d_type), so
+        # only metadata.json costs a stat. is_dir(follow_symlinks=False) is
+        # False for symlinks, which keeps them excluded.
+        try:
+            with os.scandir(self.base_path) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and _PROJECT_ID_PATTERN.match(entry.name)
+                    and os.path.exists(os.path.join(entry.path, "metadata.json"))
+                ]
+        except FileNotFoundError:
             return []
-        return [
-            d.name
-            for d in self.base_path.iterdir()
-            if d.is_dir()
-            and not d.is_symlink()
-            and _PROJECT_ID_PATTERN.match(d.name)
-            and (d / "metadata.json").exists()
-        ]
 
     def delete_project(self, project_id: str) -> None:
         """Delete a project's index from storage.
@@ -413,6 +504,11 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
     def save_bm25_index(self, project_id: str, index_data: Any) -> None:
         raise ReadOnlyStorageError("Cannot save BM25 index in read-only mode.")
 
+    def save_bm25_postings(
+        self, project_id: str, arrays: dict[str, np.ndarray]
+    ) -> None:
+        raise ReadOnlyStorageError("Cannot save BM25 postings in read-only mode.")
+
     def save_metadata(self, project_id: str, metadata: dict) -> None:
         raise ReadOnlyStorageError("Cannot save metadata in read-only mode.")
 
@@ -434,7 +530,7 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
         path = self.get_index_path(project_id) / "content_embeddings.npy"
         if path.exists():
             try:
-                return np.load(path, allow_pickle=False)
+                return np.load(path, mmap_mode="r", allow_pickle=False)
             except Exception as e:
                 logger.warning(
                     "Corrupt embeddings file for project %s (read-only, cannot remove): %s",
@@ -455,8 +551,7 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
                 )
                 return None
             try:
-                with open(json_path) as f:
-                    return json.load(f)
+                return _read_json(json_path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt BM25 index for project %s (read-only, cannot remove): %s",
@@ -466,6 +561,21 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
                 return None
         return None
 
+    def load_bm25_postings(self, project_id: str) -> dict[str, np.ndarray] | None:
+        path = self.get_index_path(project_id) / "bm25_postings.npz"
+        if path.exists():
+            try:
+                with np.load(path, allow_pickle=False) as npz:
+                    return {key: npz[key] for key in npz.files}
+            except Exception as e:
+                logger.warning(
+                    "Corrupt BM25 postings for project %s (read-only, cannot remove): %s",
+                    project_id,
+                    e,
+                )
+                return None
+        return None
+
     def load_metadata(self, project_id: str) -> dict | None:
         path = self.get_index_path(project_id) / "metadata.json"
         if path.exists():
@@ -477,8 +587,7 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
                 )
                 return None
             try:
-                with open(path) as f:
-                    return json.load(f)
+                return _read_json(path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt metadata for project %s (read-only, cannot remove): %s",
@@ -499,8 +608,7 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
                 )
                 return None
             try:
-                with open(json_path) as f:
-                    return json.load(f)
+                return _read_json(json_path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt chunks file for project %s (read-only, cannot remove): %s",
@@ -521,8 +629,7 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
                 )
                 return None
             try:
-                with open(json_path) as f:
-                    return json.load(f)
+                return _read_json(json_path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt code edges for project %s (read-only, cannot remove): %s",
@@ -543,8 +650,7 @@ class ReadOnlyFilesystemStorage(FilesystemStorage):
                 )
                 return None
             try:
-                with open(path) as f:
-                    return json.load(f)
+                return _read_json(path)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Corrupt file manifest for project %s (read-only, cannot remove): %s",
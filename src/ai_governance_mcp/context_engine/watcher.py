@@ -29,6 +29,12 @@ DEFAULT_DEBOUNCE_SECONDS = 2.0
 # Minimum gap between completed re-indexes (prevents cascading re-index loop)
 DEFAULT_COOLDOWN_SECONDS = 5.0
 
+# Watchdog event types that never change file content (read-only access)
+IGNORED_EVENT_TYPES = frozenset({"opened", "closed_no_write"})
+
+# Memoized ignore verdicts for event parent directories (cleared when full)
+MAX_DIR_VERDICTS = 4096
+
 
 class FileWatcher:
     """Watches project files for changes and triggers re-indexing.
@@ -59,19 +65,32 @@ class FileWatcher:
         self.project_path = project_path
         self.on_change = on_change
         self.ignore_spec = ignore_spec
+        # Same pruning rule as Indexer._discover_files: without negation
+        # patterns, a file under an ignored directory is always ignored.
+        self._prune_dirs = ignore_spec is not None and not any(
+            p.include is False for p in ignore_spec.patterns
+        )
+        # Parent dir (relative to project_path) → matched by ignore_spec
+        self._dir_verdicts: dict[str, bool] = {}
         self.debounce_seconds = debounce_seconds
         self.cooldown_seconds = cooldown_seconds
 
         self._observer = None
         self._pending_changes: set[Path] = set()
+        # Pending paths whose first event in this batch was a creation — they
+        # did not exist at the last flush, so a later delete cancels them
+        self._created_pending: set[Path] = set()
         self._debounce_timer: threading.Timer | None = None
+        # Monotonic time of the latest accepted event (debounce deadline base)
+        self._last_event_time: float = 0.0
         self._cooldown_timer: threading.Timer | None = None
         self._lock = threading.Lock()
         self._flush_lock = threading.Lock()  # Serializes _do_flush invocations
         self._running = threading.Event()
 
-        # Track last completed re-index time for cooldown enforcement
-        self._last_index_time: float = 0.0
+        # Monotonic time of the last completed re-index (cooldown enforcement).
+        # Monotonic so wall-clock jumps can neither skip nor stretch cooldowns.
+        self._last_index_time: float = float("-inf")
 
     def start(self) -> None:
         """Start watching for file changes."""
@@ -90,10 +109,14 @@ class FileWatcher:
                 self._watcher = watcher
 
             def on_any_event(self, event):
-                if event.is_directory:
+                if event.is_directory or event.event_type in IGNORED_EVENT_TYPES:
                     return
-                if hasattr(event, "src_path"):
-                    self._watcher._file_changed(Path(event.src_path))
+                if event.event_type == "moved":
+                    # A rename removes the source and changes the destination
+                    self._watcher._file_changed(Path(event.src_path), "deleted")
+                    self._watcher._file_changed(Path(event.dest_path), "modified")
+                elif hasattr(event, "src_path"):
+                    self._watcher._file_changed(Path(event.src_path), event.event_type)
 
         self._observer = Observer()
         self._observer.schedule(_Handler(self), str(self.project_path), recursive=True)
@@ -119,8 +142,15 @@ class FileWatcher:
                 self._cooldown_timer = None
         logger.info("File watcher stopped")
 
-    def _file_changed(self, file_path: Path) -> None:
-        """Handle a file change event with debouncing."""
+    def _file_changed(self, file_path: Path, event_type: str = "modified") -> None:
+        """Handle a file change event with debouncing.
+
+        Args:
+            file_path: Path reported by the filesystem event.
+            event_type: Watchdog event type ("created", "modified", "deleted").
+                A file created and deleted within one batch is dropped, since
+                there is nothing to add to or remove from the index.
+        """
         if not self._running.is_set():
             return
 
@@ -130,12 +160,18 @@ class FileWatcher:
         except ValueError:
             return
 
-        if self.ignore_spec is not None and self.ignore_spec.match_file(str(relative)):
+        if self._is_ignored(relative):
             return
 
         changes_to_flush = None
 
         with self._lock:
+            if event_type == "deleted" and file_path in self._created_pending:
+                self._created_pending.discard(file_path)
+                self._pending_changes.discard(file_path)
+                return
+            if event_type == "created" and file_path not in self._pending_changes:
+                self._created_pending.add(file_path)
             self._pending_changes.add(file_path)
 
             # Force-flush if pending changes exceed limit (prevents unbounded memory)
@@ -149,28 +185,70 @@ class FileWatcher:
                 # Extract changes inside lock, flush OUTSIDE lock (M2 fix)
                 changes_to_flush = list(self._pending_changes)
                 self._pending_changes.clear()
+                self._created_pending.clear()
             else:
-                # Reset debounce timer
-                if self._debounce_timer is not None:
-                    self._debounce_timer.cancel()
-
-                self._debounce_timer = threading.Timer(
-                    self.debounce_seconds, self._flush_changes
-                )
-                self._debounce_timer.daemon = True
-                self._debounce_timer.start()
+                # Push the debounce deadline back. The armed timer re-checks it
+                # when it fires, so a burst costs one timer thread per
+                # debounce window instead of one per event.
+                self._last_event_time = time.monotonic()
+                if self._debounce_timer is None:
+                    self._arm_debounce(self.debounce_seconds)
 
         # Force-flush happens outside lock to avoid blocking other events
         if changes_to_flush is not None:
             self._do_flush(changes_to_flush)
 
+    def _arm_debounce(self, delay: float) -> None:
+        """Start the debounce timer. Caller must hold self._lock."""
+        timer = threading.Timer(delay, self._debounce_expired)
+        timer.daemon = True
+        timer.start()
+        self._debounce_timer = timer
+
+    def _debounce_expired(self) -> None:
+        """Flush once debounce_seconds have passed since the latest event."""
+        with self._lock:
+            # Timer callbacks run on the Timer thread itself; a timer that was
+            # cancelled or replaced (stop, force-flush) must not act
+            if threading.current_thread() is not self._debounce_timer:
+                return
+            remaining = self._last_event_time + self.debounce_seconds - time.monotonic()
+            if remaining > 0 and self._running.is_set():
+                self._arm_debounce(remaining)
+                return
+            self._debounce_timer = None
+        self._flush_changes()
+
+    def _is_ignored(self, relative: Path) -> bool:
+        """Check a project-relative path against the ignore spec.
+
+        Event storms (git checkout, npm install) hit the same few directories
+        thousands of times, so each parent directory's verdict is memoized and
+        files under an ignored directory skip the per-pattern regex scan.
+        """
+        spec = self.ignore_spec
+        if spec is None or not spec.patterns:
+            return False
+        if self._prune_dirs:
+            parent = str(relative.parent)
+            if parent != ".":
+                ignored = self._dir_verdicts.get(parent)
+                if ignored is None:
+                    if len(self._dir_verdicts) >= MAX_DIR_VERDICTS:
+                        self._dir_verdicts.clear()
+                    ignored = spec.match_file(parent + "/")
+                    self._dir_verdicts[parent] = ignored
+                if ignored:
+                    return True
+        return spec.match_file(str(relative))
+
     def _do_flush(self, changes: list[Path]) -> None:
         """Execute the flush callback with cooldown enforcement."""
         if not self._running.is_set():
             return
 
         # Enforce cooldown: if a re-index just completed, defer
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
             last_index = self._last_index_time
         elapsed_since_last = now - last_index
@@ -212,7 +290,7 @@ class FileWatcher:
             try:
                 self.on_change(changes)
                 with self._lock:
-                    self._last_index_time = time.time()
+                    self._last_index_time = time.monotonic()
             except Exception as e:
                 logger.error("Error in change callback: %s", e)
                 # Re-queue failed changes and schedule a retry timer
@@ -236,6 +314,7 @@ class FileWatcher:
                 return
             changes = list(self._pending_changes)
             self._pending_changes.clear()
+            self._created_pending.clear()
 
         self._do_flush(changes)
 
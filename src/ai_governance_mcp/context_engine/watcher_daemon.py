@@ -327,13 +327,16 @@ def run_daemon(
     os.environ["AI_CONTEXT_ENGINE_EMBED_SOCKET"] = "none"
 
     # Import here to avoid loading ML models at import time
-    from .project_manager import ProjectManager
+    from .project_manager import ProjectManager, embedding_options_from_env
     from .storage.filesystem import FilesystemStorage
 
     storage = FilesystemStorage(base_path=base_path)
+    # Same embedding settings as the MCP server — the daemon rewrites the
+    # indexes it serves (e.g. keeps int8 storage when quantization is on)
     manager = ProjectManager(
         storage=storage,
         default_index_mode="realtime",
+        **embedding_options_from_env(),
     )
 
     # Determine which projects to watch
@@ -9,30 +9,61 @@ Covers:
 - Server (input validation, error sanitization, rate limiting)
 """
 
+import json
 import os
 import re
+import shutil
 import threading
 import time
+from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch, sentinel
 
 import numpy as np
+import pathspec
 import pytest
 from pydantic import ValidationError
 
+from ai_governance_mcp.context_engine.bm25 import (
+    BM25_POSTINGS_VERSION,
+    BM25Postings,
+)
 from ai_governance_mcp.context_engine.models import (
     CodeEdge,
     ContentChunk,
     FileMetadata,
     ProjectIndex,
+    ProjectQueryResult,
     ProjectStatus,
     QueryResult,
+    validate_chunks,
+)
+from ai_governance_mcp.context_engine.project_manager import ProjectManager
+from ai_governance_mcp.context_engine.server import (
+    SERVER_INSTRUCTIONS,
+    _create_project_manager,
+    _handle_list_projects,
+    _handle_project_status,
+    _handle_query_project,
+    _TOOLS,
+    create_server,
 )
 from ai_governance_mcp.context_engine.storage.filesystem import (
     FilesystemStorage,
     _validate_project_id,
 )
 
+# Lock types resolved once for the lock-shape assertions
+_LOCK_TYPE = type(threading.Lock())
+_RLOCK_TYPE = type(threading.RLock())
+
+# Ignore spec with no patterns, for discovery tests that ignore nothing
+_EMPTY_IGNORE_SPEC = pathspec.GitIgnoreSpec.from_lines([])
+
+# PNG signature plus padding, shared by the image connector tests
+_PNG_FIXTURE = b"\x89PNG\r\n\x1a\n" + bytes(100)
+
 
 # =============================================================================
 # Model Tests
@@ -75,6 +106,46 @@ class TestContentChunk:
         assert chunk.heading is None
         assert chunk.embedding_id is None
 
+    def test_validate_chunks_batch(self):
+        data = [
+            {
+                "content": f"c{i}",
+                "source_path": "a.py",
+                "start_line": 1,
+                "end_line": 2,
+                "content_type": "code",
+                "embedding_id": i,
+            }
+            for i in range(3)
+        ]
+        chunks = validate_chunks(data)
+        assert [c.embedding_id for c in chunks] == [0, 1, 2]
+        assert all(isinstance(c, ContentChunk) for c in chunks)
+
+        data[1]["content_type"] = "invalid_type"
+        with pytest.raises(ValidationError):
+            validate_chunks(data)
+
+    def test_validate_chunks_shares_repeated_strings(self):
+        import json
+
+        raw = [
+            {
+                "content": f"c{i}",
+                "source_path": "src/a.py",
+                "start_line": 1,
+                "end_line": 2,
+                "content_type": "code",
+                "language": "python",
+            }
+            for i in range(3)
+        ]
+        # json.loads allocates a fresh str per occurrence
+        chunks = validate_chunks(json.loads(json.dumps(raw)))
+        assert chunks[0].source_path is chunks[2].source_path
+        assert chunks[0].language is chunks[2].language
+        assert chunks[0].content_type is chunks[2].content_type
+
 
 class TestFileMetadata:
     """Test FileMetadata model."""
@@ -339,6 +410,15 @@ class TestFilesystemStorage:
     def test_load_embeddings_nonexistent(self, storage):
         assert storage.load_embeddings("aabbccdd") is None
 
+    def test_load_embeddings_is_readonly_memmap(self, storage):
+        """Embeddings are page-cache backed, not copied into process memory."""
+        pid = "abc123"
+        storage.save_embeddings(pid, np.ones((3, 384), dtype=np.float32))
+        loaded = storage.load_embeddings(pid)
+        assert isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        assert loaded.shape == (3, 384)
+
     def test_load_embeddings_allow_pickle_false(self, storage):
         """Verify numpy load uses allow_pickle=False."""
         pid = "abc123"
@@ -366,6 +446,23 @@ class TestFilesystemStorage:
     def test_load_bm25_nonexistent(self, storage):
         assert storage.load_bm25_index("aabbccdd") is None
 
+    def test_save_load_bm25_postings_roundtrip(self, storage):
+        pid = "abc123"
+        arrays = BM25Postings.from_corpus([["hello", "world"], ["test"]]).to_arrays()
+        storage.save_bm25_postings(pid, arrays)
+        loaded = storage.load_bm25_postings(pid)
+        assert loaded.keys() == arrays.keys()
+        for key, value in arrays.items():
+            np.testing.assert_array_equal(loaded[key], value)
+        assert not list(storage.get_index_path(pid).glob("*.tmp*"))
+
+    def test_corrupt_bm25_postings_removed(self, storage):
+        pid = "abc123"
+        path = storage._ensure_dir(pid) / "bm25_postings.npz"
+        path.write_bytes(b"not an npz")
+        assert storage.load_bm25_postings(pid) is None
+        assert not path.exists()
+
     def test_save_load_metadata_roundtrip(self, storage):
         pid = "abc123"
         metadata = {"project_path": "/tmp/test", "total_files": 5}
@@ -420,6 +517,46 @@ class TestFilesystemStorage:
 # =============================================================================
 
 
+class TestBM25Postings:
+    """Precomputed BM25 postings must score exactly like BM25Okapi."""
+
+    CORPUS = [
+        ["def", "hello", "world", "return", "hello"],
+        ["def", "goodbye", "world"],
+        ["class", "config", "loader", "def", "load"],
+        ["readme", "project", "overview"],
+        [],
+    ]
+
+    def test_scores_match_bm25okapi(self):
+        from rank_bm25 import BM25Okapi
+
+        postings = BM25Postings.from_corpus(self.CORPUS)
+        okapi = BM25Okapi(self.CORPUS)
+        for query in (["hello"], ["def", "world"], ["hello", "hello"], ["missing"]):
+            np.testing.assert_allclose(
+                postings.get_scores(query), okapi.get_scores(query)
+            )
+
+    def test_arrays_roundtrip_preserves_scores(self):
+        postings = BM25Postings.from_corpus(self.CORPUS)
+        restored = BM25Postings.from_arrays(postings.to_arrays())
+        assert restored.terms == postings.terms
+        np.testing.assert_array_equal(
+            restored.get_scores(["def", "load"]), postings.get_scores(["def", "load"])
+        )
+
+    def test_empty_corpus_scores_zero(self):
+        postings = BM25Postings.from_corpus([[], []])
+        np.testing.assert_array_equal(postings.get_scores(["x"]), [0.0, 0.0])
+
+    def test_version_mismatch_rejected(self):
+        arrays = BM25Postings.from_corpus(self.CORPUS).to_arrays()
+        arrays["version"] = np.array([BM25_POSTINGS_VERSION + 1], dtype=np.int32)
+        with pytest.raises(ValueError, match="version"):
+            BM25Postings.from_arrays(arrays)
+
+
 class TestCodeConnector:
     """Test code connector parsing."""
 
@@ -970,7 +1107,7 @@ class TestImageConnector:
 
         conn = ImageConnector()
         f = tmp_path / "test.png"
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        f.write_bytes(_PNG_FIXTURE)
         chunks = conn.parse(f)
         assert len(chunks) == 1
         assert chunks[0].content_type == "image"
@@ -981,7 +1118,7 @@ class TestImageConnector:
 
         conn = ImageConnector()
         f = tmp_path / "test.png"
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        f.write_bytes(_PNG_FIXTURE)
         metadata = conn.extract_metadata(f)
         assert metadata.content_type == "image"
         assert metadata.language == "png"
@@ -992,6 +1129,17 @@ class TestImageConnector:
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def _indexer_project_template(tmp_path_factory):
+    """Materialize the small TestIndexer project once per session."""
+    proj = tmp_path_factory.mktemp("indexer_template") / "testproject"
+    proj.mkdir()
+    (proj / "main.py").write_text("def main():\n    print('hello')\n")
+    (proj / "README.md").write_text("# Test Project\n\nA test.\n")
+    (proj / "data.csv").write_text("a,b,c\n1,2,3\n")
+    return proj
+
+
 class TestIndexer:
     """Test the core indexer."""
 
@@ -1000,20 +1148,22 @@ class TestIndexer:
         return FilesystemStorage(base_path=tmp_path / "indexes")
 
     @pytest.fixture
-    def project_dir(self, tmp_path):
-        """Create a small test project directory."""
-        proj = tmp_path / "testproject"
-        proj.mkdir()
-        (proj / "main.py").write_text("def main():\n    print('hello')\n")
-        (proj / "README.md").write_text("# Test Project\n\nA test.\n")
-        (proj / "data.csv").write_text("a,b,c\n1,2,3\n")
-        return proj
+    def project_dir(self, tmp_path, _indexer_project_template):
+        """Per-test copy of the session template (tests may mutate it)."""
+        return Path(
+            shutil.copytree(_indexer_project_template, tmp_path / "testproject")
+        )
 
     def test_load_ignore_patterns_default(self, project_dir):
-        from ai_governance_mcp.context_engine.indexer import Indexer
+        from ai_governance_mcp.context_engine.indexer import (
+            _DEFAULT_IGNORE_SPEC,
+            Indexer,
+        )
 
         indexer = Indexer(storage=Mock())
         spec = indexer.load_ignore_patterns(project_dir)
+        # No ignore file in the project: the precompiled defaults are reused
+        assert spec is _DEFAULT_IGNORE_SPEC
         # Default spec should match common ignored paths
         assert spec.match_file(".git/HEAD")
         assert spec.match_file("__pycache__/module.pyc")
@@ -1040,6 +1190,35 @@ class TestIndexer:
         assert spec.match_file("module.pyc")
         assert spec.match_file("build/output.js")
 
+    def test_load_ignore_patterns_cached_until_file_changes(self, project_dir):
+        import os
+
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        contextignore = project_dir / ".contextignore"
+        contextignore.write_text("*.log\n")
+        old = time.time() - 60
+        os.utime(contextignore, (old, old))
+        indexer = Indexer(storage=Mock())
+
+        spec = indexer.load_ignore_patterns(project_dir)
+        assert indexer.load_ignore_patterns(project_dir) is spec
+
+        contextignore.write_text("*.log\n*.tmp\n")
+        os.utime(contextignore, (old + 1, old + 1))
+        updated = indexer.load_ignore_patterns(project_dir)
+        assert updated is not spec
+        assert updated.match_file("scratch.tmp")
+
+    def test_load_ignore_patterns_recent_file_not_cached(self, project_dir):
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        (project_dir / ".contextignore").write_text("*.log\n")
+        indexer = Indexer(storage=Mock())
+
+        spec = indexer.load_ignore_patterns(project_dir)
+        assert indexer.load_ignore_patterns(project_dir) is not spec
+
     def test_discover_files_skips_ignored(self, project_dir):
         import pathspec
 
@@ -1052,8 +1231,6 @@ class TestIndexer:
         assert not any(f.name == "ignored.log" for f in files)
 
     def test_discover_files_skips_symlinks(self, project_dir):
-        import pathspec
-
         from ai_governance_mcp.context_engine.indexer import Indexer
 
         target = project_dir / "target.py"
@@ -1061,13 +1238,54 @@ class TestIndexer:
         link = project_dir / "link.py"
         link.symlink_to(target)
         indexer = Indexer(storage=Mock())
-        spec = pathspec.GitIgnoreSpec.from_lines([])
+        spec = _EMPTY_IGNORE_SPEC
         files = indexer._discover_files(project_dir, spec)
         assert not any(f.name == "link.py" for f in files)
 
-    def test_discover_files_skips_large_files(self, project_dir):
+    def test_discover_files_prunes_ignored_directories(self, project_dir):
         import pathspec
 
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        (project_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (project_dir / "node_modules" / "pkg" / "index.js").write_text("x")
+        (project_dir / "src" / "nested").mkdir(parents=True)
+        (project_dir / "src" / "nested" / "deep.py").write_text("x = 1")
+        indexer = Indexer(storage=Mock())
+        spec = pathspec.GitIgnoreSpec.from_lines(["node_modules/"])
+
+        scanned = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path):
+            scanned.append(os.path.basename(path))
+            return real_scandir(path)
+
+        with patch(
+            "ai_governance_mcp.context_engine.indexer.os.scandir", tracking_scandir
+        ):
+            files = indexer._discover_files(project_dir, spec)
+
+        assert "node_modules" not in scanned
+        assert project_dir / "src" / "nested" / "deep.py" in files
+        assert files == sorted(files)
+
+    def test_discover_files_negation_reincludes_under_ignored_dir(self, project_dir):
+        import pathspec
+
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        (project_dir / "build").mkdir()
+        (project_dir / "build" / "keep.py").write_text("x = 1")
+        (project_dir / "build" / "drop.py").write_text("x = 2")
+        indexer = Indexer(storage=Mock())
+        spec = pathspec.GitIgnoreSpec.from_lines(["build/", "!build/keep.py"])
+
+        names = {f.name for f in indexer._discover_files(project_dir, spec)}
+        assert "keep.py" in names
+        assert "drop.py" not in names
+
+    def test_discover_files_skips_large_files(self, project_dir):
         from ai_governance_mcp.context_engine.indexer import (
             MAX_FILE_SIZE_BYTES,
             Indexer,
@@ -1076,7 +1294,7 @@ class TestIndexer:
         large = project_dir / "large.py"
         large.write_text("x = 1\n" * (MAX_FILE_SIZE_BYTES // 5))
         indexer = Indexer(storage=Mock())
-        spec = pathspec.GitIgnoreSpec.from_lines([])
+        spec = _EMPTY_IGNORE_SPEC
         files = indexer._discover_files(project_dir, spec)
         assert not any(f.name == "large.py" for f in files)
 
@@ -1171,6 +1389,75 @@ class TestIndexer:
         assert len(texts[0]) == MAX_EMBEDDING_INPUT_CHARS
         assert texts[1] == "short"
 
+    def test_generate_embeddings_fills_across_batches(self):
+        """Batches land in order in a single float32 matrix."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        mock_model = MagicMock()
+        mock_model.encode = MagicMock(
+            side_effect=lambda texts, **kw: np.array(
+                [[float(t.split()[-1]), 1.0] for t in texts]
+            )
+        )
+        indexer._embedding_model = mock_model
+
+        chunks = [
+            ContentChunk(
+                content=f"chunk {i}",
+                source_path=f"/tmp/f{i}.py",
+                start_line=1,
+                end_line=1,
+                content_type="code",
+            )
+            for i in range(5)
+        ]
+        with patch("ai_governance_mcp.context_engine.indexer.EMBEDDING_BATCH_SIZE", 2):
+            result = indexer._generate_embeddings(chunks)
+
+        assert mock_model.encode.call_count == 3
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result[:, 0], [0, 1, 2, 3, 4])
+
+    def test_empty_embeddings_are_float32(self):
+        """Empty projects get float32 matrices, matching the non-empty path."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        assert indexer._generate_embeddings([]).dtype == np.float32
+        assert indexer._build_incremental_embeddings([], 0, []).dtype == np.float32
+
+    def test_generate_embeddings_encodes_duplicates_once(self):
+        """Identical chunk texts are encoded once and fanned back out."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        mock_model = MagicMock()
+        mock_model.encode = MagicMock(
+            side_effect=lambda texts, **kw: np.array(
+                [[float(len(t)), 1.0] for t in texts]
+            )
+        )
+        indexer._embedding_model = mock_model
+
+        chunks = [
+            ContentChunk(
+                content=content,
+                source_path=f"/tmp/f{i}.py",
+                start_line=1,
+                end_line=1,
+                content_type="code",
+            )
+            for i, content in enumerate(["x", "yy", "x", "zzz", "yy"])
+        ]
+        out = np.zeros((5, 2), dtype=np.float32)
+        result = indexer._generate_embeddings(chunks, out=out)
+
+        mock_model.encode.assert_called_once()
+        assert mock_model.encode.call_args[0][0] == ["x", "yy", "zzz"]
+        assert result is out
+        np.testing.assert_array_equal(out[:, 0], [1, 2, 1, 3, 2])
+
 
 # =============================================================================
 # Project Manager Tests
@@ -1256,6 +1543,13 @@ class TestProjectManager:
         assert len(results) == 2
         assert results[0].combined_score > results[1].combined_score
 
+    def test_iter_top_indices_matches_full_sort(self):
+        """Partial-sorted head followed by the lazily sorted tail == full sort."""
+        scores = np.random.default_rng(0).random(200)
+        expected = list(np.argsort(-scores, kind="stable"))
+        for k in (1, 10, 199, 200, 500):
+            assert list(ProjectManager._iter_top_indices(scores, k)) == expected
+
     def test_bm25_search_tokenization(self):
         """Verify BM25 query tokenization uses word-boundary splitting.
 
@@ -1286,7 +1580,7 @@ class TestProjectManager:
 
         pm = ProjectManager()
         assert hasattr(pm, "_index_lock")
-        assert isinstance(pm._index_lock, type(threading.RLock()))
+        assert type(pm._index_lock) is _RLOCK_TYPE
 
     def test_shutdown(self):
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
@@ -1357,7 +1651,7 @@ class TestServerSecurity:
         import ai_governance_mcp.context_engine.server as srv
 
         srv._index_rate_tokens = srv._INDEX_RATE_LIMIT_TOKENS
-        srv._index_rate_last_refill = time.time()
+        srv._index_rate_last_refill = time.monotonic()
 
         assert _check_index_rate_limit() is True
 
@@ -1370,10 +1664,20 @@ class TestServerSecurity:
 
         # Drain all tokens
         srv._index_rate_tokens = 0.0
-        srv._index_rate_last_refill = time.time()
+        srv._index_rate_last_refill = time.monotonic()
 
         assert srv._check_index_rate_limit() is False
 
+    def test_rate_limiter_ignores_wall_clock_jumps(self):
+        import ai_governance_mcp.context_engine.server as srv
+
+        srv._index_rate_tokens = 0.0
+        srv._index_rate_last_refill = time.monotonic()
+
+        # A forward wall-clock step (NTP sync, manual change) must not refill
+        with patch("time.time", return_value=time.time() + 3600):
+            assert srv._check_index_rate_limit() is False
+
     def test_max_query_length_constant(self):
         from ai_governance_mcp.context_engine.server import MAX_QUERY_LENGTH
 
@@ -1455,7 +1759,7 @@ class TestServerHandlers:
         import ai_governance_mcp.context_engine.server as srv
 
         srv._index_rate_tokens = 0.0
-        srv._index_rate_last_refill = time.time()
+        srv._index_rate_last_refill = time.monotonic()
 
         manager = Mock(readonly=False)
         result = await _handle_index_project(manager)
@@ -1560,6 +1864,66 @@ class TestFileWatcher:
             watcher._debounce_timer.cancel()
         assert test_file in watcher._pending_changes
 
+    def test_created_then_deleted_file_is_dropped(self, tmp_path):
+        """A file created and deleted within one batch is never flushed."""
+        from ai_governance_mcp.context_engine.watcher import FileWatcher
+
+        watcher = FileWatcher(project_path=tmp_path, on_change=Mock())
+        watcher._running.set()
+        tmp_file = tmp_path / "scratch.py"
+        kept = tmp_path / "kept.py"
+        watcher._file_changed(tmp_file, "created")
+        watcher._file_changed(tmp_file, "modified")
+        watcher._file_changed(kept, "modified")
+        watcher._file_changed(tmp_file, "deleted")
+        if watcher._debounce_timer:
+            watcher._debounce_timer.cancel()
+        assert watcher._pending_changes == {kept}
+
+    def test_deleted_then_recreated_then_deleted_is_kept(self, tmp_path):
+        """A pre-existing file removed in the batch must still reach the index."""
+        from ai_governance_mcp.context_engine.watcher import FileWatcher
+
+        watcher = FileWatcher(project_path=tmp_path, on_change=Mock())
+        watcher._running.set()
+        path = tmp_path / "existing.py"
+        watcher._file_changed(path, "deleted")
+        watcher._file_changed(path, "created")
+        watcher._file_changed(path, "deleted")
+        if watcher._debounce_timer:
+            watcher._debounce_timer.cancel()
+        assert watcher._pending_changes == {path}
+
+    def test_event_burst_reuses_one_debounce_timer(self, tmp_path):
+        """A burst arms one timer; the batch flushes once after the quiet gap."""
+        from ai_governance_mcp.context_engine.watcher import FileWatcher
+
+        flushed = threading.Event()
+        batches = []
+
+        def on_change(changes):
+            batches.append(set(changes))
+            flushed.set()
+
+        watcher = FileWatcher(
+            project_path=tmp_path,
+            on_change=on_change,
+            debounce_seconds=0.1,
+            cooldown_seconds=0,
+        )
+        watcher._running.set()
+        files = [tmp_path / f"f{i}.py" for i in range(20)]
+        watcher._file_changed(files[0])
+        timer = watcher._debounce_timer
+        for f in files[1:]:
+            watcher._file_changed(f)
+        assert watcher._debounce_timer is timer
+
+        assert flushed.wait(timeout=5)
+        assert batches == [set(files)]
+        assert watcher._debounce_timer is None
+        watcher._running.clear()
+
     def test_flush_changes_calls_callback(self, tmp_path):
         """Flushing should call the callback with pending changes."""
         from ai_governance_mcp.context_engine.watcher import FileWatcher
@@ -1643,8 +2007,6 @@ class TestProjectManagerLifecycle:
     @pytest.fixture
     def mock_indexer_pm(self, storage):
         """Create a ProjectManager with a mocked indexer."""
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         # Replace the indexer with a mock
         mock_indexer = MagicMock()
@@ -1700,8 +2062,6 @@ class TestProjectManagerLifecycle:
 
     def test_get_or_create_index_from_storage(self, storage, tmp_path):
         """If index exists in storage but not loaded, load it."""
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         project_path = tmp_path / "stored_project"
         project_path.mkdir()
@@ -1739,14 +2099,10 @@ class TestProjectManagerLifecycle:
         mock_indexer_pm._indexer.index_project.assert_called_once()
 
     def test_list_projects_empty(self, storage):
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         assert pm.list_projects() == []
 
     def test_list_projects_with_data(self, storage, tmp_path):
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         pid = "aabb1122"
         index_path = storage.get_index_path(pid)
@@ -1769,15 +2125,11 @@ class TestProjectManagerLifecycle:
         assert projects[0].total_files == 3
 
     def test_get_project_status_none(self, storage, tmp_path):
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         status = pm.get_project_status(tmp_path / "nonexistent")
         assert status is None
 
     def test_get_project_status_exists(self, storage, tmp_path):
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         project_path = tmp_path / "status_project"
         project_path.mkdir()
@@ -1801,10 +2153,53 @@ class TestProjectManagerLifecycle:
         assert status.total_files == 5
         assert status.index_mode == "ondemand"
 
+    def test_list_projects_caches_until_index_dir_changes(self, storage):
+        pm = ProjectManager(storage=storage)
+        pid = "abcd1234"
+        storage.save_metadata(pid, {"project_path": "/p", "total_files": 1})
+        index_path = storage.get_index_path(pid)
+        old = time.time() - 60
+        os.utime(index_path, (old, old))
+
+        assert pm.list_projects()[0].total_files == 1
+        with patch.object(storage, "load_metadata") as mock_load:
+            assert pm.list_projects()[0].total_files == 1
+        mock_load.assert_not_called()
+
+        # Any write renames into the directory, bumping its mtime
+        storage.save_metadata(pid, {"project_path": "/p", "total_files": 2})
+        assert pm.list_projects()[0].total_files == 2
+
+        storage.delete_project(pid)
+        assert pm.list_projects() == []
+        assert pid not in pm._status_cache
+
+    def test_list_projects_does_not_cache_fresh_mtime(self, storage):
+        """A just-written index dir may change again within the same mtime tick."""
+        pm = ProjectManager(storage=storage)
+        storage.save_metadata("abcd1234", {"project_path": "/p"})
+        pm.list_projects()
+        assert "abcd1234" not in pm._status_cache
+
+    def test_project_status_index_size_skips_symlinks(self, storage, tmp_path):
+        pm = ProjectManager(storage=storage)
+        project_path = tmp_path / "size_project"
+        project_path.mkdir()
+        pid = FilesystemStorage.project_id_from_path(project_path)
+        storage.save_metadata(pid, {"project_path": str(project_path)})
+        index_path = storage.get_index_path(pid)
+        (index_path / "chunks.json").write_bytes(b"x" * 100)
+        outside = tmp_path / "outside.bin"
+        outside.write_bytes(b"y" * 5000)
+        (index_path / "link.bin").symlink_to(outside)
+        (index_path / "subdir").mkdir()
+
+        status = pm.get_project_status(project_path)
+        expected = (index_path / "metadata.json").stat().st_size + 100
+        assert status.index_size_bytes == expected
+
     def test_query_project_empty_index(self, storage, tmp_path):
         """Querying a project with no chunks returns empty results."""
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         project_path = tmp_path / "empty_project"
         project_path.mkdir()
@@ -1826,15 +2221,57 @@ class TestProjectManagerLifecycle:
 
     def test_semantic_search_no_embeddings(self, storage):
         """Semantic search returns empty array when no embeddings loaded."""
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         pm = ProjectManager(storage=storage)
         scores = pm._semantic_search("test query", "nonexistent_project")
         assert len(scores) == 0
 
-    def test_shutdown_stops_watchers(self):
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+    def test_semantic_search_int8_matches_float(self, storage):
+        """int8-quantized embeddings score within quantization error of float32."""
+        from ai_governance_mcp.context_engine.indexer import quantize_embeddings
+
+        rng = np.random.default_rng(0)
+        emb = rng.standard_normal((50, 384)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        query = emb[:1] + 0.1 * rng.standard_normal((1, 384)).astype(np.float32)
+        query /= np.linalg.norm(query)
 
+        pm = ProjectManager(storage=storage)
+        pm._indexer._embedding_model = MagicMock()
+        pm._indexer._embedding_model.encode.return_value = query
+
+        pm._loaded_embeddings["p"] = emb
+        expected = pm._semantic_search("q", "p")
+        pm._loaded_embeddings["p"] = quantize_embeddings(emb)
+        with patch(
+            "ai_governance_mcp.context_engine.project_manager.INT8_SCORE_BLOCK_ROWS", 16
+        ):
+            scores = pm._semantic_search("q", "p")
+
+        np.testing.assert_allclose(scores, expected, atol=0.02)
+        assert int(np.argmax(scores)) == 0
+
+    def test_semantic_search_reuses_query_embedding(self, storage):
+        """Repeated query text is encoded once; the LRU evicts the oldest query."""
+        pm = ProjectManager(storage=storage)
+        pm._indexer._embedding_model = MagicMock()
+        pm._indexer._embedding_model.encode.return_value = np.ones(
+            (1, 4), dtype=np.float32
+        )
+        pm._loaded_embeddings["p"] = np.full((3, 4), 0.25, dtype=np.float32)
+
+        first = pm._semantic_search("q", "p")
+        second = pm._semantic_search("q", "p")
+        np.testing.assert_array_equal(first, second)
+        assert pm._indexer._embedding_model.encode.call_count == 1
+
+        with patch(
+            "ai_governance_mcp.context_engine.project_manager.QUERY_EMBEDDING_CACHE_SIZE",
+            1,
+        ):
+            pm._semantic_search("other", "p")
+        assert list(pm._query_embeddings) == ["other"]
+
+    def test_shutdown_stops_watchers(self):
         pm = ProjectManager()
         mock_watcher = MagicMock()
         pm._watchers["test_project"] = mock_watcher
@@ -1853,61 +2290,45 @@ class TestServerHandlersAdditional:
 
     @pytest.mark.asyncio
     async def test_handle_list_projects_empty(self):
-        from ai_governance_mcp.context_engine.server import _handle_list_projects
-
-        manager = Mock()
-        manager.list_projects.return_value = []
+        manager = SimpleNamespace(list_projects=lambda: [])
         result = await _handle_list_projects(manager)
         assert "No indexed projects" in result[0].text
 
     @pytest.mark.asyncio
     async def test_handle_list_projects_with_projects(self):
-        from ai_governance_mcp.context_engine.server import _handle_list_projects
-
-        manager = Mock()
-        manager.list_projects.return_value = [
-            ProjectStatus(
-                project_id="abc123",
-                project_path="/tmp/project",
-                total_files=3,
-                total_chunks=10,
-                index_mode="realtime",
-                last_updated="2025-01-01T00:00:00Z",
-                index_size_bytes=1024,
-                embedding_model="test-model",
-            )
-        ]
+        status = ProjectStatus(
+            project_id="abc123",
+            project_path="/tmp/project",
+            total_files=3,
+            total_chunks=10,
+            index_mode="realtime",
+            last_updated="2025-01-01T00:00:00Z",
+            index_size_bytes=1024,
+            embedding_model="test-model",
+        )
+        manager = SimpleNamespace(list_projects=lambda: [status])
         result = await _handle_list_projects(manager)
-        import json
-
         data = json.loads(result[0].text)
         assert len(data["projects"]) == 1
         assert data["projects"][0]["project_id"] == "abc123"
 
     @pytest.mark.asyncio
     async def test_handle_project_status_not_indexed(self):
-        from ai_governance_mcp.context_engine.server import _handle_project_status
-
-        manager = Mock()
-        manager.get_project_status.return_value = None
+        manager = SimpleNamespace(get_project_status=lambda path: None)
         result = await _handle_project_status(manager)
         assert "not indexed" in result[0].text
 
     @pytest.mark.asyncio
     async def test_handle_project_status_indexed(self):
-        from ai_governance_mcp.context_engine.server import _handle_project_status
-
-        manager = Mock()
-        manager.get_project_status.return_value = ProjectStatus(
+        status = ProjectStatus(
             project_id="abc123",
             project_path="/tmp/project",
             total_files=5,
             total_chunks=20,
             embedding_model="test-model",
         )
+        manager = SimpleNamespace(get_project_status=lambda path: status)
         result = await _handle_project_status(manager)
-        import json
-
         data = json.loads(result[0].text)
         assert data["total_files"] == 5
         assert data["total_chunks"] == 20
@@ -1915,9 +2336,6 @@ class TestServerHandlersAdditional:
     @pytest.mark.asyncio
     async def test_handle_query_project_with_results(self):
         """Test query handler when results are returned."""
-        from ai_governance_mcp.context_engine.server import _handle_query_project
-        from ai_governance_mcp.context_engine.models import ProjectQueryResult
-
         chunk = ContentChunk(
             content="def hello(): pass",
             source_path="/tmp/test.py",
@@ -1941,12 +2359,9 @@ class TestServerHandlersAdditional:
             total_results=1,
             query_time_ms=12.5,
         )
-        manager = Mock()
-        manager.query_project.return_value = query_result
+        manager = SimpleNamespace(query_project=lambda **kwargs: query_result)
 
         result = await _handle_query_project(manager, {"query": "hello"})
-        import json
-
         data = json.loads(result[0].text)
         assert data["total_results"] == 1
         assert data["results"][0]["file"] == "/tmp/test.py"
@@ -1955,9 +2370,6 @@ class TestServerHandlersAdditional:
     @pytest.mark.asyncio
     async def test_handle_query_project_no_results(self):
         """Test query handler when no results are returned."""
-        from ai_governance_mcp.context_engine.server import _handle_query_project
-        from ai_governance_mcp.context_engine.models import ProjectQueryResult
-
         query_result = ProjectQueryResult(
             query="nonexistent",
             project_id="abc123",
@@ -1965,12 +2377,11 @@ class TestServerHandlersAdditional:
             results=[],
             total_results=0,
         )
-        manager = Mock(readonly=False)
-        manager.query_project.return_value = query_result
+        manager = SimpleNamespace(
+            readonly=False, query_project=lambda **kwargs: query_result
+        )
 
         result = await _handle_query_project(manager, {"query": "nonexistent"})
-        import json
-
         data = json.loads(result[0].text)
         assert data["total_results"] == 0
         assert "not be indexed" in data["message"]
@@ -2049,8 +2460,6 @@ class TestEnvVarParsing:
     """Test server environment variable parsing robustness."""
 
     def test_invalid_embedding_dimensions(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict(
             "os.environ", {"AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS": "not_a_number"}
         ):
@@ -2058,8 +2467,6 @@ class TestEnvVarParsing:
             assert pm.embedding_dimensions == 384  # fallback default
 
     def test_negative_embedding_dimensions(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict(
             "os.environ", {"AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS": "-100"}
         ):
@@ -2067,36 +2474,26 @@ class TestEnvVarParsing:
             assert pm.embedding_dimensions == 384  # fallback default
 
     def test_zero_embedding_dimensions(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict("os.environ", {"AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS": "0"}):
             pm = _create_project_manager()
             assert pm.embedding_dimensions == 384  # fallback default
 
     def test_invalid_semantic_weight(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict("os.environ", {"AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT": "abc"}):
             pm = _create_project_manager()
             assert pm.semantic_weight == 0.7  # fallback default
 
     def test_semantic_weight_clamped_high(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict("os.environ", {"AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT": "5.0"}):
             pm = _create_project_manager()
             assert pm.semantic_weight == 1.0  # clamped to max
 
     def test_semantic_weight_clamped_low(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict("os.environ", {"AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT": "-2.0"}):
             pm = _create_project_manager()
             assert pm.semantic_weight == 0.0  # clamped to min
 
     def test_valid_custom_dimensions(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict(
             "os.environ", {"AI_CONTEXT_ENGINE_EMBEDDING_DIMENSIONS": "768"}
         ):
@@ -2104,12 +2501,21 @@ class TestEnvVarParsing:
             assert pm.embedding_dimensions == 768
 
     def test_valid_custom_weight(self):
-        from ai_governance_mcp.context_engine.server import _create_project_manager
-
         with patch.dict("os.environ", {"AI_CONTEXT_ENGINE_SEMANTIC_WEIGHT": "0.3"}):
             pm = _create_project_manager()
             assert pm.semantic_weight == 0.3
 
+    def test_quantize_embeddings_opt_in(self):
+        with patch.dict(
+            "os.environ", {"AI_CONTEXT_ENGINE_QUANTIZE_EMBEDDINGS": "true"}
+        ):
+            pm = _create_project_manager()
+            assert pm._indexer.quantize_embeddings is True
+
+    def test_quantize_embeddings_default_off(self):
+        pm = _create_project_manager()
+        assert pm._indexer.quantize_embeddings is False
+
 
 # =============================================================================
 # QueryResult Constraint Tests
@@ -2195,18 +2601,11 @@ class TestCreateServer:
     """Test the create_server function and SERVER_INSTRUCTIONS wiring."""
 
     def test_server_created(self):
-        from ai_governance_mcp.context_engine.server import create_server
-
         server, manager = create_server()
         assert server is not None
         assert manager is not None
 
     def test_server_instructions_wired(self):
-        from ai_governance_mcp.context_engine.server import (
-            SERVER_INSTRUCTIONS,
-            create_server,
-        )
-
         server, _ = create_server()
         # The Server constructor accepts instructions as a parameter
         # Verify the constant is non-empty
@@ -2214,29 +2613,51 @@ class TestCreateServer:
         assert "query_project" in SERVER_INSTRUCTIONS
         assert "index_project" in SERVER_INSTRUCTIONS
 
+    @pytest.mark.asyncio
+    async def test_list_tools_serves_prebuilt_definitions(self):
+        from mcp.types import ListToolsRequest
+
+        server, _ = create_server()
+        handler = server.request_handlers[ListToolsRequest]
+        result = await handler(ListToolsRequest(method="tools/list"))
+        names = [t.name for t in result.root.tools]
+        assert names == [t.name for t in _TOOLS]
+        assert len(set(names)) == len(names)
+        assert "query_project" in names
+
 
 # =============================================================================
 # Integration Test — Index → Query Pipeline
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def _integration_project_template(tmp_path_factory):
+    """Materialize the realistic integration project once per session."""
+    proj = tmp_path_factory.mktemp("integration_template") / "integration_project"
+    proj.mkdir()
+    (proj / "main.py").write_text(
+        "def hello():\n    return 'hello world'\n\n"
+        "def goodbye():\n    return 'goodbye world'\n"
+    )
+    (proj / "README.md").write_text(
+        "# Integration Test Project\n\nThis is a test project for integration testing.\n"
+    )
+    (proj / "data.csv").write_text("name,age\nAlice,30\nBob,25\n")
+    return proj
+
+
 class TestIntegrationIndexQuery:
     """End-to-end test of the index→query pipeline with mocked embeddings."""
 
     @pytest.fixture
-    def project_dir(self, tmp_path):
-        """Create a realistic test project."""
-        proj = tmp_path / "integration_project"
-        proj.mkdir()
-        (proj / "main.py").write_text(
-            "def hello():\n    return 'hello world'\n\n"
-            "def goodbye():\n    return 'goodbye world'\n"
-        )
-        (proj / "README.md").write_text(
-            "# Integration Test Project\n\nThis is a test project for integration testing.\n"
+    def project_dir(self, tmp_path, _integration_project_template):
+        """Per-test copy of the session template (tests may mutate it)."""
+        return Path(
+            shutil.copytree(
+                _integration_project_template, tmp_path / "integration_project"
+            )
         )
-        (proj / "data.csv").write_text("name,age\nAlice,30\nBob,25\n")
-        return proj
 
     def test_index_and_query_pipeline(self, project_dir, storage):
         """Full pipeline: index a project, then query it."""
@@ -2249,26 +2670,28 @@ class TestIntegrationIndexQuery:
 
         # Return different embeddings for different chunks so semantic search is meaningful
         def mock_encode(texts, **kwargs):
-            embeddings = []
-            for i, text in enumerate(texts):
-                vec = np.zeros(384)
-                # Create slightly different vectors based on content
-                if "hello" in text.lower():
-                    vec[0] = 0.9
-                    vec[1] = 0.1
-                elif "goodbye" in text.lower():
-                    vec[0] = 0.1
-                    vec[1] = 0.9
-                elif "integration" in text.lower() or "project" in text.lower():
-                    vec[2] = 0.9
-                else:
-                    vec[i % 384] = 0.5
-                # Normalize
-                norm = np.linalg.norm(vec)
-                if norm > 0:
-                    vec = vec / norm
-                embeddings.append(vec)
-            return np.array(embeddings, dtype=np.float32)
+            # Batched: one preallocated matrix, masks select the slots to set
+            out = np.zeros((len(texts), 384), dtype=np.float32)
+            lowered = [t.lower() for t in texts]
+            hello = np.array(["hello" in t for t in lowered], dtype=bool)
+            goodbye = np.array(["goodbye" in t for t in lowered], dtype=bool)
+            goodbye &= ~hello
+            proj = np.array(
+                ["integration" in t or "project" in t for t in lowered], dtype=bool
+            )
+            proj &= ~(hello | goodbye)
+            other = np.nonzero(~(hello | goodbye | proj))[0]
+
+            out[hello, 0] = 0.9
+            out[hello, 1] = 0.1
+            out[goodbye, 0] = 0.1
+            out[goodbye, 1] = 0.9
+            out[proj, 2] = 0.9
+            out[other, other % 384] = 0.5
+
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            return out / norms
 
         mock_model.encode = mock_encode
         indexer._embedding_model = mock_model
@@ -2291,6 +2714,46 @@ class TestIntegrationIndexQuery:
         top_result = result.results[0]
         assert top_result.combined_score > 0
 
+    def test_bm25_postings_loaded_lazily(self, project_dir, storage):
+        """Postings are persisted at index time and loaded on first query."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=storage)
+        mock_model = MagicMock()
+        mock_model.encode = lambda texts, **kw: np.zeros((len(texts), 384))
+        indexer._embedding_model = mock_model
+
+        pid = FilesystemStorage.project_id_from_path(project_dir)
+        indexer.index_project(project_dir, pid)
+        assert storage.load_bm25_postings(pid) is not None
+
+        pm = ProjectManager(storage=storage)
+        pm._indexer = indexer
+        pm.get_or_create_index(project_dir)
+        assert pid not in pm._loaded_bm25
+
+        result = pm.query_project("hello", project_dir)
+        assert pid in pm._loaded_bm25
+        assert isinstance(pm._loaded_bm25[pid], BM25Postings)
+        assert result.total_results > 0
+
+    def test_failed_artifact_write_skips_commit_records(self, project_dir, storage):
+        """Concurrent data writes must all succeed before metadata/manifest."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=storage)
+        mock_model = MagicMock()
+        mock_model.encode = lambda texts, **kw: np.zeros((len(texts), 384))
+        indexer._embedding_model = mock_model
+
+        pid = FilesystemStorage.project_id_from_path(project_dir)
+        with patch.object(storage, "save_embeddings", side_effect=OSError("disk")):
+            with pytest.raises(OSError, match="disk"):
+                indexer.index_project(project_dir, pid)
+
+        assert storage.load_metadata(pid) is None
+        assert storage.load_file_manifest(pid) is None
+
     def test_index_respects_contextignore(self, project_dir, storage):
         """Verify that .contextignore patterns are respected during indexing."""
         from ai_governance_mcp.context_engine.indexer import Indexer
@@ -2300,7 +2763,9 @@ class TestIntegrationIndexQuery:
 
         indexer = Indexer(storage=storage)
         mock_model = MagicMock()
-        mock_model.encode = MagicMock(return_value=np.zeros((5, 384)))
+        mock_model.encode = MagicMock(
+            side_effect=lambda texts, **kw: np.zeros((len(texts), 384))
+        )
         indexer._embedding_model = mock_model
 
         pid = FilesystemStorage.project_id_from_path(project_dir)
@@ -2326,124 +2791,107 @@ class TestRateLimiterThreadSafety:
         import ai_governance_mcp.context_engine.server as srv
 
         assert hasattr(srv, "_rate_limit_lock")
-        assert isinstance(srv._rate_limit_lock, type(threading.Lock()))
+        assert type(srv._rate_limit_lock) is _LOCK_TYPE
 
     def test_rate_limiter_concurrent_access(self):
         """Verify rate limiter doesn't corrupt state under concurrent access."""
+        from concurrent.futures import ThreadPoolExecutor
+
         import ai_governance_mcp.context_engine.server as srv
 
         # Reset state
         srv._index_rate_tokens = srv._INDEX_RATE_LIMIT_TOKENS
-        srv._index_rate_last_refill = time.time()
+        srv._index_rate_last_refill = time.monotonic()
 
-        results = []
+        # All 10 workers are released together so the calls truly overlap
+        start = threading.Barrier(10, timeout=5)
 
         def consume_token():
-            result = srv._check_index_rate_limit()
-            results.append(result)
+            start.wait()
+            return srv._check_index_rate_limit()
 
-        # Launch 10 threads simultaneously trying to consume tokens
-        threads = [threading.Thread(target=consume_token) for _ in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            futures = [pool.submit(consume_token) for _ in range(10)]
+            results = [f.result() for f in futures]
 
         # Should have exactly 5 True (one per token) and 5 False
         assert results.count(True) == 5
         assert results.count(False) == 5
 
 
+class _HoldTrackingLock:
+    """Wraps a lock and records how deeply it is held (owner-agnostic probe)."""
+
+    def __init__(self, lock):
+        self._lock = lock
+        self.depth = 0
+
+    def __enter__(self):
+        self._lock.__enter__()
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.depth -= 1
+        return self._lock.__exit__(*exc_info)
+
+
 class TestLockCoverage:
     """SEC-HIGH-3: Verify get_or_create_index and reindex_project hold lock."""
 
     def test_get_or_create_index_acquires_lock(self):
         """get_or_create_index should hold _index_lock during execution.
 
-        Uses a separate thread to verify the lock is held (RLock is reentrant,
-        so same-thread checks would always succeed).
+        The lock is wrapped so the callee can observe that it is held, without
+        relying on RLock owner semantics or a second probing thread.
         """
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
 
         pm = ProjectManager()
         pm._loaded_indexes["test_id"] = Mock()
+        pm._index_lock = _HoldTrackingLock(pm._index_lock)
 
-        lock_held_from_other_thread = []
-        barrier = threading.Barrier(2, timeout=5)
+        lock_depth_inside = []
 
-        def blocking_project_id(path):
-            # Signal that we're inside the locked section
-            barrier.wait()
-            # Wait for the checker thread to probe the lock
-            time.sleep(0.05)
+        def recording_project_id(path):
+            lock_depth_inside.append(pm._index_lock.depth)
             return "test_id"
 
-        def check_lock():
-            # Wait until we know we're inside the locked section
-            barrier.wait()
-            # Try to acquire from this (different) thread
-            acquired = pm._index_lock.acquire(blocking=False)
-            if acquired:
-                pm._index_lock.release()
-                lock_held_from_other_thread.append(False)
-            else:
-                lock_held_from_other_thread.append(True)
-
         with patch.object(
             FilesystemStorage,
             "project_id_from_path",
-            side_effect=blocking_project_id,
+            side_effect=recording_project_id,
         ):
-            checker = threading.Thread(target=check_lock)
-            checker.start()
             pm.get_or_create_index(Path("/fake"))
-            checker.join()
 
-        assert lock_held_from_other_thread == [True]
+        assert lock_depth_inside and lock_depth_inside[0] > 0
+        assert pm._index_lock.depth == 0
 
     def test_reindex_project_acquires_lock(self):
-        """reindex_project should hold _index_lock during execution.
-
-        Uses a separate thread to verify the lock is held.
-        """
+        """reindex_project should hold _index_lock during execution."""
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
 
         pm = ProjectManager()
-        pm.storage = Mock()
-        pm.storage.load_metadata.return_value = {"index_mode": "ondemand"}
-        pm._indexer = Mock()
-        mock_index = Mock()
-        pm._indexer.index_project.return_value = mock_index
-        pm.storage.load_embeddings.return_value = None
-        pm.storage.load_bm25_index.return_value = None
-
-        lock_held_from_other_thread = []
-        barrier = threading.Barrier(2, timeout=5)
+        # Plain stubs with only what reindex_project touches
+        pm.storage = SimpleNamespace(
+            load_embeddings=lambda project_id: None,
+            load_code_edges=lambda project_id: None,
+        )
+        pm._index_lock = _HoldTrackingLock(pm._index_lock)
 
-        original_index = pm._indexer.index_project
+        lock_depth_inside = []
 
-        def blocking_index(*args, **kwargs):
-            barrier.wait()
-            time.sleep(0.05)
-            return original_index(*args, **kwargs)
+        def recording_index(project_path, project_id, index_mode):
+            lock_depth_inside.append(pm._index_lock.depth)
+            # The index is only passed through, so a sentinel stands in for it
+            return sentinel.index
 
-        pm._indexer.index_project = blocking_index
+        pm._indexer = SimpleNamespace(index_project=recording_index)
 
-        def check_lock():
-            barrier.wait()
-            acquired = pm._index_lock.acquire(blocking=False)
-            if acquired:
-                pm._index_lock.release()
-                lock_held_from_other_thread.append(False)
-            else:
-                lock_held_from_other_thread.append(True)
+        assert pm.reindex_project(Path("/fake")) is sentinel.index
 
-        checker = threading.Thread(target=check_lock)
-        checker.start()
-        pm.reindex_project(Path("/fake"))
-        checker.join()
-
-        assert lock_held_from_other_thread == [True]
+        assert lock_depth_inside and lock_depth_inside[0] > 0
+        assert pm._index_lock.depth == 0
 
 
 class TestSignalHandlerCleanup:
@@ -2451,8 +2899,6 @@ class TestSignalHandlerCleanup:
 
     def test_main_creates_manager_ref(self):
         """main() should capture manager reference for signal handler."""
-        from ai_governance_mcp.context_engine.server import create_server
-
         server, manager = create_server()
         assert manager is not None
         assert hasattr(manager, "shutdown")
@@ -2468,9 +2914,9 @@ class TestEnvIgnorePatterns:
         assert ".env" not in DEFAULT_IGNORE_PATTERNS
 
     def test_env_variants_ignored(self):
-        import pathspec
+        from ai_governance_mcp.context_engine.indexer import _DEFAULT_IGNORE_SPEC
 
-        spec = pathspec.GitIgnoreSpec.from_lines([".env*"])
+        spec = _DEFAULT_IGNORE_SPEC
         assert spec.match_file(".env")
         assert spec.match_file(".env.local")
         assert spec.match_file(".env.production")
@@ -2478,6 +2924,16 @@ class TestEnvIgnorePatterns:
         assert spec.match_file(".env.development")
 
 
+@pytest.fixture(scope="session")
+def _file_count_project(tmp_path_factory):
+    """15 empty .py files — more than the patched limit; read-only."""
+    root = tmp_path_factory.mktemp("file_count_project")
+    # Contents are never read by discovery, so empty files suffice
+    for i in range(15):
+        (root / f"file_{i}.py").touch()
+    return root
+
+
 class TestFileCountLimit:
     """SEC-MED-2: File count limit during indexing."""
 
@@ -2486,59 +2942,58 @@ class TestFileCountLimit:
 
         assert MAX_FILE_COUNT == 10_000
 
-    def test_discover_files_enforces_limit(self, tmp_path):
-        import pathspec
-
+    def test_discover_files_enforces_limit(self, _file_count_project):
         from ai_governance_mcp.context_engine.indexer import Indexer
 
-        # Create more files than a small limit
-        for i in range(15):
-            (tmp_path / f"file_{i}.py").write_text(f"x = {i}")
-
         indexer = Indexer(storage=Mock())
-        spec = pathspec.GitIgnoreSpec.from_lines([])
+        spec = _EMPTY_IGNORE_SPEC
 
         # Monkey-patch MAX_FILE_COUNT to a small value for testing
         with patch("ai_governance_mcp.context_engine.indexer.MAX_FILE_COUNT", 10):
-            files = indexer._discover_files(tmp_path, spec)
+            files = indexer._discover_files(_file_count_project, spec)
         assert len(files) <= 10
 
 
+@pytest.fixture(scope="class")
+def _png_project(tmp_path_factory):
+    """One read-only project with images/test.png, shared per test class."""
+    root = tmp_path_factory.mktemp("png_project")
+    (root / "images").mkdir()
+    (root / "images" / "test.png").write_bytes(_PNG_FIXTURE)
+    return root, root / "images" / "test.png"
+
+
 class TestImageConnectorFixes:
     """SEC-MED-5, SEC-MED-6, CODE-MED-4: Image connector improvements."""
 
-    def test_relative_path_in_output(self, tmp_path):
+    def test_relative_path_in_output(self, _png_project):
         """Image content should use relative path, not absolute."""
         from ai_governance_mcp.context_engine.connectors.image import ImageConnector
 
+        root, f = _png_project
         conn = ImageConnector()
-        f = tmp_path / "images" / "test.png"
-        f.parent.mkdir(parents=True, exist_ok=True)
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-        chunks = conn.parse(f, project_root=tmp_path)
+        chunks = conn.parse(f, project_root=root)
         assert len(chunks) == 1
         # Should contain relative path, not absolute
         content = chunks[0].content
-        assert str(tmp_path) not in content or "images/test.png" in content
+        assert str(root) not in content or "images/test.png" in content
 
-    def test_1_based_line_numbers(self, tmp_path):
+    def test_1_based_line_numbers(self, _png_project):
         """Image chunks should use 1-based line numbers."""
         from ai_governance_mcp.context_engine.connectors.image import ImageConnector
 
+        _, f = _png_project
         conn = ImageConnector()
-        f = tmp_path / "test.png"
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
         chunks = conn.parse(f)
         assert chunks[0].start_line == 1
         assert chunks[0].end_line == 1
 
-    def test_parse_without_project_root(self, tmp_path):
+    def test_parse_without_project_root(self, _png_project):
         """parse() without project_root should fall back to full path (consistent with other connectors)."""
         from ai_governance_mcp.context_engine.connectors.image import ImageConnector
 
+        _, f = _png_project
         conn = ImageConnector()
-        f = tmp_path / "test.png"
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
         chunks = conn.parse(f)
         assert len(chunks) == 1
         # Without project_root, display_path is str(file_path) — the full path
@@ -2548,18 +3003,22 @@ class TestImageConnectorFixes:
 class TestUnknownToolStructuredError:
     """CODE-HIGH-4: Unknown tool returns structured JSON error."""
 
-    def test_unknown_tool_response_is_valid_json(self):
-        """The unknown tool error response at server.py should be structured JSON."""
-        # Verify the code structure by importing and checking the source
-        import inspect
-
-        from ai_governance_mcp.context_engine import server
+    @pytest.mark.asyncio
+    async def test_unknown_tool_response_is_valid_json(self):
+        """The unknown tool error response should be structured JSON."""
+        from mcp.types import CallToolRequest, CallToolRequestParams
 
-        source = inspect.getsource(server.create_server)
-        # The unknown tool branch should contain json.dumps and valid_tools
-        assert "json.dumps" in source
-        assert "valid_tools" in source
-        assert "Unknown tool" in source
+        server, _ = create_server()
+        handler = server.request_handlers[CallToolRequest]
+        result = await handler(
+            CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(name="no_such_tool", arguments={}),
+            )
+        )
+        payload = json.loads(result.root.content[0].text)
+        assert payload["error"] == "Unknown tool: no_such_tool"
+        assert payload["valid_tools"] == [t.name for t in _TOOLS]
 
 
 class TestDeadCodeRemoval:
@@ -2580,6 +3039,20 @@ class TestDeadCodeRemoval:
 class TestConnectorRelativePaths:
     """Test that all connectors produce relative source_path when project_root is provided."""
 
+    def test_relative_display_path_edge_cases(self, tmp_path):
+        from ai_governance_mcp.context_engine.connectors.base import (
+            relative_display_path,
+        )
+
+        root = tmp_path / "proj"
+        nested = root / "src" / "main.py"
+        sibling = tmp_path / "proj2" / "main.py"
+        assert relative_display_path(nested, root) == str(Path("src", "main.py"))
+        # Shared string prefix is not containment
+        assert relative_display_path(sibling, root) == str(sibling)
+        assert relative_display_path(root, root) == "."
+        assert relative_display_path(nested, None) == str(nested)
+
     def test_code_connector_relative_path(self, tmp_path):
         from ai_governance_mcp.context_engine.connectors.code import CodeConnector
 
@@ -2661,7 +3134,7 @@ class TestConnectorRelativePaths:
         sub = tmp_path / "assets"
         sub.mkdir()
         f = sub / "logo.png"
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        f.write_bytes(_PNG_FIXTURE)
         chunks = conn.parse(f, project_root=tmp_path)
         assert len(chunks) == 1
         assert chunks[0].source_path == "assets/logo.png"
@@ -2671,7 +3144,7 @@ class TestConnectorRelativePaths:
 
         conn = ImageConnector()
         f = tmp_path / "photo.png"
-        f.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        f.write_bytes(_PNG_FIXTURE)
         chunks = conn.parse(f)
         assert len(chunks) == 1
         assert chunks[0].source_path == str(f)
@@ -2755,6 +3228,44 @@ class TestResourceCleanupOnException:
             # Document must be closed despite the error
             mock_doc.close.assert_called_once()
 
+    def test_pdfplumber_flushes_each_page_cache(self, tmp_path):
+        """pdfplumber pages release their parsed layout as they are consumed."""
+        pymupdf = pytest.importorskip("pymupdf")
+        pytest.importorskip("pdfplumber")
+        from pdfplumber.page import Page
+
+        from ai_governance_mcp.context_engine.connectors.pdf import PDFConnector
+
+        f = tmp_path / "doc.pdf"
+        doc = pymupdf.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"page {i + 1} text")
+        doc.save(str(f))
+        doc.close()
+
+        conn = PDFConnector()
+        conn._has_pymupdf = False
+        conn._has_pdfplumber = True
+
+        # Record, as each page is extracted, how much the earlier pages
+        # still hold in their textmap caches
+        seen: list = []
+        held: list[int] = []
+        original = Page.extract_text
+
+        def spy(page, *args, **kwargs):
+            held.extend(p.get_textmap.cache_info().currsize for p in seen)
+            text = original(page, *args, **kwargs)
+            seen.append(page)
+            return text
+
+        with patch.object(Page, "extract_text", spy):
+            chunks = conn.parse(f)
+
+        assert [c.heading for c in chunks] == ["Page 1", "Page 2", "Page 3"]
+        assert len(held) == 3  # page 1 checked twice, page 2 once
+        assert held == [0, 0, 0]
+
 
 class TestListProjectsSymlinkExclusion:
     """Test that list_projects excludes symlinks in storage directory."""
@@ -2805,6 +3316,20 @@ class TestListProjectsSymlinkExclusion:
         assert external_target.exists()
         assert (external_target / "metadata.json").exists()
 
+    def test_symlink_to_prefix_sibling_blocked(self, tmp_path):
+        """A sibling dir sharing the storage path's string prefix is outside."""
+        storage_dir = tmp_path / "storage"
+        storage_dir.mkdir()
+        storage = FilesystemStorage(base_path=storage_dir)
+        sibling = tmp_path / "storage2"
+        sibling.mkdir()
+
+        sym_id = "abcdef1234567890"
+        (storage_dir / sym_id).symlink_to(sibling)
+
+        with pytest.raises(ValueError, match="Path traversal detected"):
+            storage.get_index_path(sym_id)
+
 
 class TestBm25ZeroScoreNormalization:
     """Test that BM25 normalization handles zero/empty scores without errors."""
@@ -2835,6 +3360,20 @@ class TestBm25ZeroScoreNormalization:
         assert scores.max() == pytest.approx(1.0)
         assert scores.min() == pytest.approx(0.25)
 
+    def test_negative_scores_floored_and_input_untouched(self):
+        """Negative BM25 scores clip to 0; the scorer's array is not mutated."""
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        pm = ProjectManager()
+        raw = np.array([-1.0, 2.0, 4.0])
+        mock_bm25 = Mock()
+        mock_bm25.get_scores = Mock(return_value=raw)
+        pm._loaded_bm25["test_project"] = mock_bm25
+
+        scores = pm._bm25_search("query", "test_project")
+        np.testing.assert_allclose(scores, [0.0, 0.5, 1.0])
+        np.testing.assert_array_equal(raw, [-1.0, 2.0, 4.0])
+
     def test_empty_scores_array(self):
         """Empty BM25 result should return empty array."""
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
@@ -2907,6 +3446,76 @@ class TestJsonFileSizeLimits:
         result = storage.load_file_manifest(project_id)
         assert result is None
 
+    def test_stdlib_json_used_without_orjson(self, tmp_path):
+        """Without orjson installed, files parse with the stdlib decoder."""
+        storage = FilesystemStorage(base_path=tmp_path)
+        project_id = "d" * 16
+        project_dir = tmp_path / project_id
+        project_dir.mkdir()
+        (project_dir / "metadata.json").write_text(
+            '{"score": NaN, "big": 123456789012345678901234567890}'
+        )
+
+        with patch("ai_governance_mcp.context_engine.storage.filesystem.orjson", None):
+            result = storage.load_metadata(project_id)
+        assert result["big"] == 123456789012345678901234567890
+        assert result["score"] != result["score"]  # NaN
+
+    def test_stdlib_only_json_still_loads(self, tmp_path):
+        """NaN and >64-bit ints (rejected by orjson) load as with json.load."""
+        storage = FilesystemStorage(base_path=tmp_path)
+        project_id = "d" * 16
+        project_dir = tmp_path / project_id
+        project_dir.mkdir()
+        (project_dir / "metadata.json").write_text(
+            '{"score": NaN, "big": 123456789012345678901234567890}'
+        )
+
+        result = storage.load_metadata(project_id)
+        assert result["big"] == 123456789012345678901234567890
+        assert result["score"] != result["score"]  # NaN
+        assert (project_dir / "metadata.json").exists()
+
+    def test_corrupt_json_raises_json_decode_error(self, tmp_path):
+        """Undecodable input surfaces as json.JSONDecodeError either way."""
+        from ai_governance_mcp.context_engine.storage.filesystem import _read_json
+
+        path = tmp_path / "bad.json"
+        path.write_text("{not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            _read_json(path)
+
+    def test_non_finite_frontmatter_survives_index_and_load(self, tmp_path):
+        """YAML .inf/.nan/huge ints in frontmatter round-trip through chunks.json."""
+        storage = FilesystemStorage(base_path=tmp_path / "indexes")
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "notes.md").write_text(
+            "---\n"
+            "weight: .inf\n"
+            "ratio: .nan\n"
+            "serial: 123456789012345678901234567890\n"
+            "---\n"
+            "# Notes\n\nSome body text for the chunk.\n"
+        )
+
+        def _mock_encode(texts, **kw):
+            return np.ones((len(texts), 384), dtype=np.float32) / np.sqrt(384)
+
+        with patch("sentence_transformers.SentenceTransformer") as mock_st:
+            mock_st.return_value = MagicMock(encode=_mock_encode)
+            index = ProjectManager(storage=storage).get_or_create_index(project_dir)
+        pid = index.project_id
+        assert index.chunks
+
+        reloaded = ProjectManager(storage=storage)._load_project(pid)
+        assert (storage.get_index_path(pid) / "chunks.json").exists()
+        assert len(reloaded.chunks) == len(index.chunks)
+        frontmatter = next(c.frontmatter for c in reloaded.chunks if c.frontmatter)
+        assert frontmatter["weight"] == float("inf")
+        assert frontmatter["serial"] == 123456789012345678901234567890
+
     def test_normal_sized_files_load_fine(self, tmp_path):
         """Files under the size limit should load normally."""
         storage = FilesystemStorage(base_path=tmp_path)
@@ -2964,8 +3573,20 @@ class TestStorageDirectoryPermissions:
 
         # _ensure_dir should tighten
         storage._ensure_dir(project_id)
-        mode = project_dir.stat().st_mode & 0o777
-        assert mode == 0o700  # Should be tightened to 0o700
+        mode = project_dir.stat().st_mode & 0o777
+        assert mode == 0o700  # Should be tightened to 0o700
+
+    def test_ensure_dir_skips_chmod_when_mode_correct(self, tmp_path):
+        """An existing 0o700 project dir is not re-created or re-chmodded."""
+        storage = FilesystemStorage(base_path=tmp_path)
+        project_id = "a" * 16
+        storage._ensure_dir(project_id)
+
+        with patch(
+            "ai_governance_mcp.context_engine.storage.filesystem.os.chmod"
+        ) as mock_chmod:
+            storage._ensure_dir(project_id)
+        mock_chmod.assert_not_called()
 
 
 class TestModelAllowlist:
@@ -2982,6 +3603,15 @@ class TestModelAllowlist:
         with pytest.raises(ValueError, match="not in the allowed list"):
             _ = indexer.embedding_model
 
+    def test_disallowed_model_rejected_before_import(self):
+        """Allowlist rejection must not import sentence-transformers."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock(), embedding_model="evil-org/backdoor-model")
+        with patch.dict("sys.modules", {"sentence_transformers": None}):
+            with pytest.raises(ValueError, match="not in the allowed list"):
+                _ = indexer.embedding_model
+
     def test_allowed_model_accepted(self):
         """Models in the allowlist should not raise (mocked to avoid download)."""
         from ai_governance_mcp.context_engine.indexer import Indexer
@@ -3096,6 +3726,35 @@ class TestWatcherIgnoreSpecPassthrough:
             watcher._debounce_timer.cancel()
         assert py_file in watcher._pending_changes
 
+    def test_ignored_dir_verdict_memoized(self, tmp_path):
+        """Repeat events under an ignored dir reuse the cached dir verdict."""
+        from ai_governance_mcp.context_engine.watcher import FileWatcher
+
+        spec = pathspec.GitIgnoreSpec.from_lines(["node_modules/"])
+        watcher = FileWatcher(project_path=tmp_path, on_change=Mock(), ignore_spec=spec)
+        watcher._running.set()
+
+        with patch.object(spec, "match_file", wraps=spec.match_file) as spy:
+            for i in range(5):
+                watcher._file_changed(tmp_path / "node_modules" / "pkg" / f"{i}.js")
+        assert watcher._pending_changes == set()
+        spy.assert_called_once_with(str(Path("node_modules", "pkg")) + "/")
+
+    def test_negation_spec_matches_each_file(self, tmp_path):
+        """Negation patterns can re-include files under an ignored dir."""
+        from ai_governance_mcp.context_engine.watcher import FileWatcher
+
+        spec = pathspec.GitIgnoreSpec.from_lines(["build/*", "!build/keep.py"])
+        watcher = FileWatcher(project_path=tmp_path, on_change=Mock(), ignore_spec=spec)
+        watcher._running.set()
+
+        watcher._file_changed(tmp_path / "build" / "junk.o")
+        keep = tmp_path / "build" / "keep.py"
+        watcher._file_changed(keep)
+        if watcher._debounce_timer:
+            watcher._debounce_timer.cancel()
+        assert watcher._pending_changes == {keep}
+
 
 class TestWatcherCircuitBreaker:
     """Test that watcher stops after consecutive failures."""
@@ -3196,7 +3855,7 @@ class TestHandleIndexProjectSuccess:
 
         # Reset rate limiter
         srv._index_rate_tokens = srv._INDEX_RATE_LIMIT_TOKENS
-        srv._index_rate_last_refill = time.time()
+        srv._index_rate_last_refill = time.monotonic()
 
         mock_index = ProjectIndex(
             project_id="abc123",
@@ -3442,7 +4101,9 @@ class TestEmbeddingsChunksMismatch:
         pm._loaded_indexes[pid] = index
 
         # Save mismatched embeddings (5 rows vs 3 chunks)
-        storage.save_embeddings(pid, np.random.rand(5, 384).astype(np.float32))
+        storage.save_embeddings(
+            pid, np.random.default_rng(0).standard_normal((5, 384), dtype=np.float32)
+        )
 
         # Load search indexes — should detect mismatch and discard
         pm._load_search_indexes(pid)
@@ -3480,7 +4141,9 @@ class TestEmbeddingsChunksMismatch:
         pm._loaded_indexes[pid] = index
 
         # Save matching embeddings (3 rows for 3 chunks)
-        embeddings = np.random.rand(3, 384).astype(np.float32)
+        embeddings = np.random.default_rng(0).standard_normal(
+            (3, 384), dtype=np.float32
+        )
         storage.save_embeddings(pid, embeddings)
 
         pm._load_search_indexes(pid)
@@ -3489,6 +4152,75 @@ class TestEmbeddingsChunksMismatch:
         assert pid in pm._loaded_embeddings
         assert pm._loaded_embeddings[pid].shape[0] == 3
 
+    @staticmethod
+    def _three_chunk_index(pid, model):
+        return ProjectIndex(
+            project_id=pid,
+            project_path="/tmp/test",
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+            embedding_model=model,
+            chunks=[
+                ContentChunk(
+                    content=f"chunk {i}",
+                    source_path="test.py",
+                    start_line=i,
+                    end_line=i,
+                    content_type="code",
+                    embedding_id=i,
+                )
+                for i in range(3)
+            ],
+        )
+
+    def test_larger_model_with_default_dimensions_kept(self, tmp_path):
+        """A 768-dim model works without setting embedding_dimensions."""
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        storage = FilesystemStorage(base_path=tmp_path / "indexes")
+        pm = ProjectManager(storage=storage)  # embedding_dimensions defaults to 384
+        pid = "aabbccdd"
+        pm._loaded_indexes[pid] = self._three_chunk_index(pid, "BAAI/bge-base-en-v1.5")
+        embeddings = np.random.default_rng(0).standard_normal(
+            (3, 768), dtype=np.float32
+        )
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        storage.save_embeddings(pid, embeddings)
+
+        pm._load_search_indexes(pid)
+        assert pm._loaded_embeddings[pid].shape == (3, 768)
+
+        pm._indexer._embedding_model = MagicMock()
+        pm._indexer._embedding_model.encode.return_value = embeddings[:1]
+        scores = pm._semantic_search("q", pid)
+        assert int(np.argmax(scores)) == 0
+
+    def test_one_dimensional_embeddings_discarded(self, tmp_path):
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        storage = FilesystemStorage(base_path=tmp_path / "indexes")
+        pm = ProjectManager(storage=storage)
+        pid = "aabbccdd"
+        pm._loaded_indexes[pid] = self._three_chunk_index(pid, "BAAI/bge-small-en-v1.5")
+        storage.save_embeddings(pid, np.ones(3, dtype=np.float32))
+
+        pm._load_search_indexes(pid)
+
+        assert pid not in pm._loaded_embeddings
+
+    def test_width_mismatch_with_query_falls_back_to_bm25(self, storage):
+        """Stored vectors of a different width than the query yield no scores."""
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        pm = ProjectManager(storage=storage)
+        pm._indexer._embedding_model = MagicMock()
+        pm._indexer._embedding_model.encode.return_value = np.ones(
+            (1, 384), dtype=np.float32
+        )
+        pm._loaded_embeddings["p"] = np.ones((3, 768), dtype=np.float32)
+
+        assert len(pm._semantic_search("q", "p")) == 0
+
 
 class TestCorruptMetadataRecovery:
     """Test _load_project corrupt metadata recovery path."""
@@ -3520,6 +4252,66 @@ class TestCorruptMetadataRecovery:
         assert index.project_id == pid
         assert len(index.chunks) == 0
 
+    def test_corrupt_chunks_file_returns_empty_index(self, tmp_path):
+        """An invalid chunk in chunks.json falls back to an empty index."""
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        storage = FilesystemStorage(base_path=tmp_path / "indexes")
+        pm = ProjectManager(storage=storage)
+        pid = "aabbccdd"
+        storage.save_metadata(
+            pid,
+            {
+                "project_id": pid,
+                "project_path": "/tmp/test",
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-01-01T00:00:00Z",
+                "embedding_model": "BAAI/bge-small-en-v1.5",
+            },
+        )
+        storage.save_chunks(pid, [{"content": "x", "start_line": "not_an_int"}])
+
+        index = pm._load_project(pid)
+        assert index.project_id == pid
+        assert index.chunks == []
+
+    @pytest.mark.parametrize("chunks_data", [[1, 2], ["x"], {"a": 1}])
+    def test_wrong_shape_chunks_file_returns_empty_index(self, tmp_path, chunks_data):
+        """Valid JSON of the wrong shape in chunks.json is treated as corrupt."""
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        storage = FilesystemStorage(base_path=tmp_path / "indexes")
+        pm = ProjectManager(storage=storage)
+        pid = "aabbccdd"
+        storage.save_metadata(
+            pid,
+            {
+                "project_id": pid,
+                "project_path": "/tmp/test",
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-01-01T00:00:00Z",
+                "embedding_model": "BAAI/bge-small-en-v1.5",
+            },
+        )
+        storage.save_chunks(pid, chunks_data)
+
+        index = pm._load_project(pid)
+        assert index.project_id == pid
+        assert index.chunks == []
+
+    def test_non_object_metadata_returns_empty_index(self, tmp_path):
+        """A metadata.json holding a JSON array falls back to an empty index."""
+        from ai_governance_mcp.context_engine.project_manager import ProjectManager
+
+        storage = FilesystemStorage(base_path=tmp_path / "indexes")
+        pm = ProjectManager(storage=storage)
+        pid = "aabbccdd"
+        storage.save_metadata(pid, ["not", "an", "object"])
+
+        index = pm._load_project(pid)
+        assert index.project_id == pid
+        assert index.chunks == []
+
     def test_missing_metadata_raises(self, tmp_path):
         """Non-existent project should raise ValueError."""
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
@@ -3677,6 +4469,25 @@ class TestWatcherGenerationCounter:
 class TestWatcherCooldownRequeue:
     """Test _do_flush cooldown re-queue and error retry paths."""
 
+    def test_cooldown_ignores_wall_clock_jumps(self, tmp_path):
+        """Cooldown runs on the monotonic clock; a wall-clock jump is ignored."""
+        from ai_governance_mcp.context_engine.watcher import FileWatcher
+
+        callback = Mock()
+        watcher = FileWatcher(
+            project_path=tmp_path, on_change=callback, cooldown_seconds=10.0
+        )
+        watcher._running.set()
+        watcher._do_flush([tmp_path / "a.py"])
+        callback.assert_called_once()
+
+        # Wall clock jumps a day ahead: cooldown must still be active
+        with patch("time.time", return_value=time.time() + 86_400):
+            watcher._do_flush([tmp_path / "b.py"])
+        callback.assert_called_once()
+        if watcher._cooldown_timer is not None:
+            watcher._cooldown_timer.cancel()
+
     def test_cooldown_requeues_changes(self, tmp_path):
         """Changes during cooldown should be re-queued, not dropped."""
         from ai_governance_mcp.context_engine.watcher import FileWatcher
@@ -3691,7 +4502,7 @@ class TestWatcherCooldownRequeue:
 
         # Simulate a recent index completion (cooldown active)
         with watcher._lock:
-            watcher._last_index_time = time.time()
+            watcher._last_index_time = time.monotonic()
 
         # Try to flush during cooldown
         changes = [tmp_path / "file1.py", tmp_path / "file2.py"]
@@ -4220,6 +5031,32 @@ class TestCollectUnchangedChunks:
         assert len(vectors) == 1
         np.testing.assert_array_equal(vectors[0], [1.0, 2.0, 3.0])
 
+    def test_int8_vectors_dequantized(self):
+        """Quantized vectors are rescaled so they mix with fresh float embeddings."""
+        from ai_governance_mcp.context_engine.indexer import (
+            Indexer,
+            quantize_embeddings,
+        )
+
+        indexer = Indexer(storage=Mock())
+        chunks_data = [
+            {
+                "content": "def hello(): pass",
+                "source_path": "a.py",
+                "start_line": 1,
+                "end_line": 1,
+                "content_type": "code",
+                "embedding_id": 0,
+            },
+        ]
+        vec = np.array([[0.6, -0.8, 0.0]], dtype=np.float32)
+
+        _, vectors = indexer._collect_unchanged_chunks(
+            chunks_data, ["/proj/a.py"], quantize_embeddings(vec)
+        )
+        assert vectors[0].dtype == np.float32
+        np.testing.assert_allclose(vectors[0], vec[0], atol=1 / 127)
+
     def test_deleted_file_chunks_removed(self):
         from ai_governance_mcp.context_engine.indexer import Indexer
 
@@ -4243,6 +5080,30 @@ class TestCollectUnchangedChunks:
         assert len(chunks) == 0
         assert len(vectors) == 0
 
+    def test_matches_whole_path_components(self):
+        """Relative sources match absolute paths only at a separator."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        chunks_data = [
+            {
+                "content": f"chunk {i}",
+                "source_path": source,
+                "start_line": 1,
+                "end_line": 1,
+                "content_type": "code",
+                "embedding_id": i,
+            }
+            for i, source in enumerate(["src/a.py", "ta.py", "data.py"])
+        ]
+        old_embeddings = np.eye(3, dtype=np.float32)
+
+        chunks, vectors = indexer._collect_unchanged_chunks(
+            chunks_data, ["/proj/src/a.py", "/proj/data.py"], old_embeddings
+        )
+        assert [c.source_path for c in chunks] == ["src/a.py", "data.py"]
+        np.testing.assert_array_equal(vectors, old_embeddings[[0, 2]])
+
 
 class TestBuildIncrementalEmbeddings:
     """Test _build_incremental_embeddings reuses and generates correctly."""
@@ -4338,6 +5199,43 @@ class TestBuildIncrementalEmbeddings:
         result = indexer._build_incremental_embeddings([], 0, [])
         assert result.shape == (0, 3)
 
+    def test_new_embeddings_written_into_result_rows(self):
+        """New batches are encoded into the result matrix, not a separate array."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock(), embedding_dimensions=3)
+        chunks = [
+            ContentChunk(
+                content=name,
+                source_path=f"{name}.py",
+                start_line=1,
+                end_line=1,
+                content_type="code",
+                embedding_id=i,
+            )
+            for i, name in enumerate(["old", "new1", "new2"])
+        ]
+        unchanged_vectors = np.array([[1.0, 2.0, 3.0]], dtype=np.float32)
+
+        with patch("sentence_transformers.SentenceTransformer") as mock_st:
+            mock_model = MagicMock()
+            mock_model.encode = lambda texts, **kw: np.full(
+                (len(texts), 3), 9.0, dtype=np.float32
+            )
+            mock_st.return_value = mock_model
+
+            with patch.object(
+                indexer, "_generate_embeddings", wraps=indexer._generate_embeddings
+            ) as gen:
+                result = indexer._build_incremental_embeddings(
+                    chunks, 1, unchanged_vectors
+                )
+
+        out = gen.call_args.kwargs["out"]
+        assert np.shares_memory(out, result)
+        np.testing.assert_array_equal(result[0], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(result[1:], np.full((2, 3), 9.0))
+
 
 class TestIncrementalNoChangeFastPath:
     """Test that no-change scenario returns existing index without re-embedding."""
@@ -4402,6 +5300,142 @@ class TestIncrementalNoChangeFastPath:
         assert result.total_chunks == 1
 
 
+class TestIncrementalStatFastPath:
+    """Test _current_hashes reuses manifest hashes when size+mtime match."""
+
+    @staticmethod
+    def _entry(path, content_hash="stored"):
+        st = path.stat()
+        return {
+            "content_hash": content_hash,
+            "size_bytes": st.st_size,
+            "last_modified": st.st_mtime,
+        }
+
+    def test_matching_stat_skips_hashing(self, tmp_path):
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        f = tmp_path / "a.py"
+        f.write_text("x = 1")
+        manifest = {str(f): self._entry(f)}
+        scan_started_at = datetime.fromtimestamp(
+            f.stat().st_mtime + 60, timezone.utc
+        ).isoformat()
+
+        with patch.object(indexer, "_file_hash") as mock_hash:
+            hashes = indexer._current_hashes([f], manifest, scan_started_at)
+        mock_hash.assert_not_called()
+        assert hashes == {str(f): "stored"}
+
+    def test_changed_mtime_rehashes(self, tmp_path):
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        f = tmp_path / "a.py"
+        f.write_text("x = 1")
+        entry = self._entry(f)
+        entry["last_modified"] -= 10
+        scan_started_at = datetime.now(timezone.utc).isoformat()
+
+        hashes = indexer._current_hashes([f], {str(f): entry}, scan_started_at)
+        assert hashes[str(f)] == indexer._file_hash(f)
+
+    def test_racy_mtime_rehashes(self, tmp_path):
+        """A file touched right before the last scan can't be trusted by stat."""
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        f = tmp_path / "a.py"
+        f.write_text("x = 1")
+        scan_started_at = datetime.fromtimestamp(f.stat().st_mtime, timezone.utc)
+
+        hashes = indexer._current_hashes(
+            [f], {str(f): self._entry(f)}, scan_started_at.isoformat()
+        )
+        assert hashes[str(f)] == indexer._file_hash(f)
+
+    @pytest.mark.parametrize(
+        ("scan_offset", "expect_rehash"),
+        [(0.0, True), (None, True), (60.0, False)],
+        ids=["racy-scan", "legacy-no-scan-time", "settled-scan"],
+    )
+    def test_guard_uses_scan_start_not_updated_at(
+        self, tmp_path, scan_offset, expect_rehash
+    ):
+        """A long index run must not make racily stat'ed files trusted.
+
+        updated_at lands well after the file's mtime (the run spent minutes
+        embedding), but the scan itself started in the file's mtime tick.
+        """
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock(), embedding_dimensions=3)
+        project_dir = tmp_path / "proj"
+        project_dir.mkdir()
+        f = project_dir / "a.py"
+        f.write_text("def hello(): pass")
+        mtime = f.stat().st_mtime
+
+        def iso(ts):
+            return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+        metadata = {
+            "index_mode": "ondemand",
+            "chunking_version": indexer._get_chunking_version(),
+            "created_at": iso(mtime + 600),
+            "updated_at": iso(mtime + 600),
+            "embedding_model": "BAAI/bge-small-en-v1.5",
+            "total_chunks": 1,
+            "total_files": 1,
+        }
+        if scan_offset is not None:
+            metadata["scan_started_at"] = iso(mtime + scan_offset)
+        indexer.storage.load_metadata = Mock(return_value=metadata)
+        indexer.storage.load_file_manifest = Mock(
+            return_value={
+                str(f): {
+                    **self._entry(f, indexer._file_hash(f)),
+                    "path": str(f),
+                    "content_type": "code",
+                    "language": "python",
+                    "chunk_count": 1,
+                }
+            }
+        )
+        indexer.storage.load_chunks = Mock(
+            return_value=[
+                {
+                    "content": "def hello(): pass",
+                    "source_path": "a.py",
+                    "start_line": 1,
+                    "end_line": 1,
+                    "content_type": "code",
+                    "embedding_id": 0,
+                }
+            ]
+        )
+        indexer.storage.load_embeddings = Mock(return_value=np.ones((1, 3)))
+        indexer.index_project = Mock()
+
+        with patch.object(indexer, "_file_hash", wraps=indexer._file_hash) as spy:
+            result = indexer.incremental_update(project_dir, "test_id", [])
+
+        indexer.index_project.assert_not_called()
+        assert result.total_chunks == 1
+        assert spy.called is expect_rehash
+
+    def test_no_index_timestamp_hashes_everything(self, tmp_path):
+        from ai_governance_mcp.context_engine.indexer import Indexer
+
+        indexer = Indexer(storage=Mock())
+        f = tmp_path / "a.py"
+        f.write_text("x = 1")
+
+        hashes = indexer._current_hashes([f], {str(f): self._entry(f)}, None)
+        assert hashes[str(f)] == indexer._file_hash(f)
+
+
 class TestSchemaAndChunkingVersion:
     """Test schema_version and chunking_version in ProjectIndex."""
 
@@ -5326,21 +6360,31 @@ class TestRankingSignals:
         assert ProjectManager._classify_file_type("docs/guide.txt") == "other"
         assert ProjectManager._classify_file_type("config.yaml") == "other"
 
-    def test_recent_file_boosted(self):
+    def _recency_bonus(self, path, recency_map):
+        """Recency part of _compute_bonuses: bonuses with the map minus without."""
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
 
+        pm = ProjectManager(reranking=False)
+        chunks = [self._make_chunk(path)]
+        with_map = pm._compute_bonuses(chunks, recency_map, "")
+        without_map = pm._compute_bonuses(chunks, None, "")
+        return float(with_map[0] - without_map[0])
+
+    def test_recent_file_boosted(self):
         now = time.time()
         recency_map = {"recent.py": now - 3600}  # 1 hour ago
-        bonus = ProjectManager._compute_recency_bonus("recent.py", recency_map)
-        assert bonus == 0.01
+        assert self._recency_bonus("recent.py", recency_map) == pytest.approx(0.01)
 
     def test_stale_file_penalized(self):
-        from ai_governance_mcp.context_engine.project_manager import ProjectManager
-
         now = time.time()
         recency_map = {"old.py": now - 100 * 86400}  # 100 days ago
-        bonus = ProjectManager._compute_recency_bonus("old.py", recency_map)
-        assert bonus == -0.01
+        assert self._recency_bonus("old.py", recency_map) == pytest.approx(-0.01)
+
+    def test_mid_age_and_unknown_files_neutral(self):
+        now = time.time()
+        recency_map = {"mid.py": now - 30 * 86400}
+        assert self._recency_bonus("mid.py", recency_map) == 0.0
+        assert self._recency_bonus("unlisted.py", recency_map) == 0.0
 
     def test_bonuses_are_additive(self):
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
@@ -5355,6 +6399,49 @@ class TestRankingSignals:
         # 0.5 * 0.5 + 0.5 * 0.5 + 0.02 = 0.52
         assert abs(results[0].combined_score - 0.52) < 0.001
 
+    def test_vectorized_bonuses_match_per_chunk(self):
+        """Column-wise bonuses equal the per-chunk components; columns are cached."""
+        from ai_governance_mcp.context_engine.project_manager import (
+            FILE_TYPE_BONUSES,
+            RECENCY_RECENT_BONUS,
+            RECENCY_STALE_PENALTY,
+            ProjectManager,
+        )
+
+        pm = ProjectManager(semantic_weight=0.5, reranking=False)
+        chunks = [
+            self._make_chunk("src/main.py"),
+            self._make_chunk("tests/test_main.py"),
+            self._make_chunk("README.md"),
+            self._make_chunk("unknown.py"),
+        ]
+        chunks[2].frontmatter = {"tags": ["deploy"], "status": "deprecated"}
+        now = time.time()
+        recency_map = {
+            "src/main.py": now - 3600,
+            "tests/test_main.py": now - 100 * 86400,
+            "README.md": now - 30 * 86400,
+        }
+        query_lower = "deploy steps"
+
+        bonuses = pm._compute_bonuses(chunks, recency_map, query_lower, "p1")
+        # recent, stale, mid-age, unknown
+        recency = [RECENCY_RECENT_BONUS, RECENCY_STALE_PENALTY, 0.0, 0.0]
+        expected = [
+            FILE_TYPE_BONUSES.get(pm._classify_file_type(c.source_path), 0.0)
+            + recency[i]
+            + pm._compute_metadata_bonus(c, query_lower)
+            for i, c in enumerate(chunks)
+        ]
+        np.testing.assert_allclose(bonuses, expected)
+
+        columns = pm._bonus_columns["p1"][2]
+        pm._compute_bonuses(chunks, recency_map, "other", "p1")
+        assert pm._bonus_columns["p1"][2] is columns
+        # A new chunk list (e.g. after a watcher swap) rebuilds the columns
+        pm._compute_bonuses(list(chunks), recency_map, "other", "p1")
+        assert pm._bonus_columns["p1"][2] is not columns
+
     def test_combined_score_clamped_to_unit(self):
         from ai_governance_mcp.context_engine.project_manager import ProjectManager
 
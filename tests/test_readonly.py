@@ -167,6 +167,10 @@ class TestReadOnlyFilesystemStorage:
         projects = readonly.list_projects()
         assert set(projects) == {"abcdef1234567890", "1234567890abcdef"}
 
+    def test_list_projects_missing_base_path(self, tmp_path):
+        readonly = ReadOnlyFilesystemStorage(base_path=tmp_path / "nonexistent")
+        assert readonly.list_projects() == []
+
     def test_corrupt_embeddings_logs_warning_no_unlink(self, tmp_path):
         """Corrupt files should log warning but NOT be deleted in read-only mode.
 
@@ -760,3 +760,58 @@ class TestHeartbeatEmbedSocket:
 
         assert mock_write.called
         assert mock_write.call_args.kwargs.get("embed_socket") == "/tmp/embed.sock"
+
+
+# =============================================================================
+# Embedding settings shared with the MCP server
+# =============================================================================
+
+
+class TestDaemonEmbeddingOptions:
+    """run_daemon builds its ProjectManager with the server's embedding env."""
+
+    def test_incremental_update_keeps_int8_embeddings(self, tmp_path):
+        import numpy as np
+
+        from ai_governance_mcp.context_engine import project_manager, watcher_daemon
+
+        base = tmp_path / "indexes"
+        base.mkdir()
+        project = tmp_path / "project"
+        project.mkdir()
+        source = project / "app.py"
+        source.write_text("def handler():\n    return 1\n")
+
+        real_manager = project_manager.ProjectManager
+        built = []
+
+        def build_manager(*args, **kwargs):
+            built.append(real_manager(*args, **kwargs))
+            return built[-1]
+
+        def _mock_encode(texts, **kw):
+            return np.ones((len(texts), 384), dtype=np.float32) / np.sqrt(384)
+
+        env = {
+            "AI_CONTEXT_ENGINE_INDEX_PATH": str(base),
+            "AI_CONTEXT_ENGINE_QUANTIZE_EMBEDDINGS": "true",
+        }
+        with (
+            patch.dict(os.environ, env),
+            patch.object(project_manager, "ProjectManager", side_effect=build_manager),
+            patch("sentence_transformers.SentenceTransformer") as mock_st,
+        ):
+            mock_st.return_value = MagicMock(encode=_mock_encode)
+            # No realtime projects yet — the daemon exits right after
+            # building its manager
+            with pytest.raises(SystemExit):
+                watcher_daemon.run_daemon(max_uptime_seconds=0)
+
+            manager = built[0]
+            index = manager.get_or_create_index(project, index_mode="ondemand")
+            source.write_text("def handler():\n    return 2\n")
+            manager._indexer.incremental_update(project, index.project_id, [source])
+
+        embeddings = manager.storage.load_embeddings(index.project_id)
+        assert manager._indexer.quantize_embeddings is True
+        assert embeddings.dtype == np.int8